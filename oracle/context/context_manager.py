@@ -19,14 +19,64 @@ Features:
 import os
 import json
 import time
-from datetime import datetime
+import threading
+from datetime import date, datetime
+from functools import wraps
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 # Get project root
-PROJECT_ROOT = Path(__file__).parent.parent.parent  # Up from context/ to oracle/ to root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent  # Up from context/ to oracle/ to root
+
+# Filesystems where inotify/FSEvents miss remote changes
+NETWORK_FS_TYPES = frozenset({"cifs", "smbfs", "smb3", "nfs", "nfs4", "afpfs", "fuse.sshfs", "9p"})
+
+
+def _db_locked(method):
+    """Run a ContextManager DB method under its DB lock (the commit timer runs on another thread)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._db_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def is_network_fs(path: Path) -> bool:
+    """Check whether path lives on a network filesystem (Linux /proc/self/mountinfo; False elsewhere)."""
+    try:
+        mountinfo = Path("/proc/self/mountinfo").read_text()
+    except OSError:
+        return False
+
+    target = str(Path(path).resolve())
+    best_mount, best_type = "", None
+    for line in mountinfo.splitlines():
+        fields = line.split(" - ", 1)
+        if len(fields) != 2:
+            continue
+        mount_point = fields[0].split()[4].replace("\\040", " ")
+        fs_type = fields[1].split()[0]
+        if (target == mount_point or target.startswith(mount_point.rstrip("/") + "/")) \
+                and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+# Formatted "Last Updated" date, re-formatted only when the day changes
+_DATE_CACHE = [0, ""]
+
+
+def _today_str() -> str:
+    """Return today's date as 'Month DD, YYYY', cached per day."""
+    today = date.today()
+    ordinal = today.toordinal()
+    if _DATE_CACHE[0] != ordinal:
+        _DATE_CACHE[0] = ordinal
+        _DATE_CACHE[1] = today.strftime('%B %d, %Y')
+    return _DATE_CACHE[1]
 
 
 class ContextType:
@@ -78,14 +128,29 @@ class ContextPaths:
         ContextType.POCKET: [],  # Pocket watches nothing directly - it syncs via iCloud
     }
 
+    # Existing watch directories, computed once on first use
+    _existing: Optional[Dict[str, tuple]] = None
+
+    @classmethod
+    def existing_watch_dirs(cls) -> Dict[str, tuple]:
+        """Get WATCH_DIRS filtered to directories that exist (stat'd once)."""
+        if cls._existing is None:
+            cls._existing = {
+                ctx: tuple(p for p in dirs if p.exists())
+                for ctx, dirs in cls.WATCH_DIRS.items()
+            }
+        return cls._existing
+
 
 class FileActivityTracker:
     """Tracks file activity to determine active context."""
 
-    def __init__(self):
+    def __init__(self, on_activity: Optional[Callable[[str, str, str], None]] = None):
         self.activity: Dict[str, List[Dict]] = {ctx: [] for ctx in ContextType.all()}
         self.last_activity: Dict[str, datetime] = {}
         self.activity_window = 300  # 5 minutes
+        self._change_event = threading.Event()
+        self.on_activity = on_activity
 
     def record_activity(self, context: str, file_path: str, event_type: str):
         """Record file activity for a context."""
@@ -101,6 +166,16 @@ class FileActivityTracker:
         if len(self.activity[context]) > 100:
             self.activity[context] = self.activity[context][-100:]
 
+        self._change_event.set()
+        if self.on_activity:
+            self.on_activity(context, file_path, event_type)
+
+    def wait_for_activity(self, timeout: Optional[float] = None) -> bool:
+        """Block until activity is recorded (or timeout). Returns True if activity occurred."""
+        changed = self._change_event.wait(timeout=timeout)
+        self._change_event.clear()
+        return changed
+
     def get_active_context(self) -> Optional[str]:
         """Determine which context is currently active based on recent activity."""
         now = datetime.now()
@@ -162,17 +237,52 @@ class ContextFileHandler(FileSystemEventHandler):
                 return True
         return False
 
+    def context_for(self, path: str) -> Optional[str]:
+        """Get the context an event path belongs to."""
+        return self.context
+
+    def _record(self, event: FileSystemEvent, event_type: str):
+        if event.is_directory or self.should_ignore(event.src_path):
+            return
+        context = self.context_for(event.src_path)
+        if context:
+            self.tracker.record_activity(context, event.src_path, event_type)
+
     def on_modified(self, event: FileSystemEvent):
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.tracker.record_activity(self.context, event.src_path, "modified")
+        self._record(event, "modified")
 
     def on_created(self, event: FileSystemEvent):
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.tracker.record_activity(self.context, event.src_path, "created")
+        self._record(event, "created")
 
     def on_deleted(self, event: FileSystemEvent):
-        if not event.is_directory and not self.should_ignore(event.src_path):
-            self.tracker.record_activity(self.context, event.src_path, "deleted")
+        self._record(event, "deleted")
+
+
+class ContextDispatchHandler(ContextFileHandler):
+    """Single handler that dispatches events to contexts by longest path prefix."""
+
+    def __init__(self, tracker: FileActivityTracker, watch_dirs: Dict[str, tuple]):
+        super().__init__(tracker, None)
+        # (prefix with trailing separator, context), longest prefix first
+        self.prefix_map = sorted(
+            ((str(dir_path) + os.sep, ctx) for ctx, dirs in watch_dirs.items() for dir_path in dirs),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def context_for(self, path: str) -> Optional[str]:
+        for prefix, ctx in self.prefix_map:
+            if path.startswith(prefix):
+                return ctx
+        return None
+
+    def watch_roots(self) -> List[str]:
+        """Get the minimal set of directories to schedule (nested dirs are covered by parents)."""
+        roots: List[str] = []
+        for prefix in sorted({p for p, _ in self.prefix_map}, key=len):
+            if not any(prefix.startswith(root) for root in roots):
+                roots.append(prefix)
+        return [root.rstrip(os.sep) for root in roots]
 
 
 class ContextManager:
@@ -192,14 +302,42 @@ class ContextManager:
         manager.stop()  # Stop file watching
     """
 
-    def __init__(self, db_session=None, fallback_mode: bool = False):
-        self.tracker = FileActivityTracker()
-        self.observer = Observer()
+    def __init__(
+        self,
+        db_session=None,
+        fallback_mode: bool = False,
+        on_activity: Optional[Callable[[str, str, str], None]] = None,
+        force_poll: bool = False,
+    ):
+        self.tracker = FileActivityTracker(on_activity=on_activity)
+        # Native watchers miss events on network mounts; poll there instead
+        self.force_poll = force_poll
+        self.observer = PollingObserver() if force_poll else Observer()
         self.db = db_session
         self.running = False
         self.max_context_lines = 500
         self.fallback_mode = fallback_mode
 
+        # Context file cache: path -> ((mtime_ns, size), content, line_count)
+        self._file_cache: Dict[str, tuple] = {}
+
+        # Mini reachability cache: (monotonic timestamp, reachable)
+        self._mini_status_cache: Optional[tuple] = None
+        self.mini_status_ttl = 5.0
+
+        # Batched DB commits: flush per write, commit every N writes or T seconds.
+        # A timer commits a deferred batch after commit_interval even if no
+        # further write arrives; _db_lock serializes it with session use.
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.commit_batch_size = 16
+        self.commit_interval = 1.0
+        self._commit_timer: Optional[threading.Timer] = None
+        self._db_lock = threading.RLock()
+
+        # app.models, imported on first DB use
+        self._models = None
+
         # Server ports
         self.ports = {
             "backend": 5002 if fallback_mode else 5001,
@@ -208,22 +346,21 @@ class ContextManager:
 
     def start(self):
         """Start file watching for all contexts."""
-        for context, dirs in ContextPaths.WATCH_DIRS.items():
-            handler = ContextFileHandler(self.tracker, context)
-            for dir_path in dirs:
-                if dir_path.exists():
-                    self.observer.schedule(handler, str(dir_path), recursive=True)
+        handler = ContextDispatchHandler(self.tracker, ContextPaths.existing_watch_dirs())
+        for root in handler.watch_roots():
+            self.observer.schedule(handler, root, recursive=True)
 
         self.observer.start()
         self.running = True
 
         mode_str = "FALLBACK" if self.fallback_mode else "NORMAL"
-        print(f"[ContextManager] Started in {mode_str} mode")
+        print(f"[ContextManager] Started in {mode_str} mode ({'polling' if self.force_poll else 'native'} watcher)")
         print(f"[ContextManager] Ports: backend={self.ports['backend']}, frontend={self.ports['frontend']}")
         print(f"[ContextManager] Watching {len(ContextPaths.WATCH_DIRS)} contexts")
 
     def stop(self):
         """Stop file watching."""
+        self.flush_pending()
         self.observer.stop()
         self.observer.join()
         self.running = False
@@ -241,19 +378,61 @@ class ContextManager:
         """Get path to context file."""
         return ContextPaths.FILES.get(context)
 
+    def _load_context_file(self, context: str, need_content: bool = True) -> Optional[tuple]:
+        """
+        Return cached ((mtime_ns, size), content, line_count), re-reading only when the file changes.
+
+        With need_content=False the file is counted as raw bytes without decoding,
+        and the cached content may be None.
+        """
+        path = self.get_context_file_path(context)
+        if not path:
+            return None
+
+        try:
+            st = path.stat()
+        except OSError:
+            self._file_cache.pop(str(path), None)
+            return None
+
+        key = str(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(key)
+        if cached and cached[0] == stamp and (cached[1] is not None or not need_content):
+            return cached
+
+        if need_content:
+            content = path.read_text()
+            entry = (stamp, content, content.count("\n") + 1 if content else 0)
+        else:
+            entry = (stamp, None, self._count_lines(path))
+        self._file_cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _count_lines(path: Path) -> int:
+        """Count lines by scanning raw bytes in chunks (no decode, no split)."""
+        newlines = 0
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                newlines += chunk.count(b"\n")
+                size += len(chunk)
+        return newlines + 1 if size else 0
+
+    def _invalidate_cache(self, path: Path):
+        """Drop a cached context file after writing it."""
+        self._file_cache.pop(str(path), None)
+
     def read_context_file(self, context: str) -> Optional[str]:
         """Read a context file."""
-        path = self.get_context_file_path(context)
-        if path and path.exists():
-            return path.read_text()
-        return None
+        entry = self._load_context_file(context)
+        return entry[1] if entry else None
 
     def get_context_line_count(self, context: str) -> int:
         """Get line count of a context file."""
-        content = self.read_context_file(context)
-        if content:
-            return len(content.split("\n"))
-        return 0
+        entry = self._load_context_file(context, need_content=False)
+        return entry[2] if entry else 0
 
     def update_context_file(self, context: str, section: str, content: str) -> bool:
         """
@@ -274,7 +453,7 @@ class ContextManager:
         file_content = path.read_text()
         lines = file_content.split("\n")
 
-        # Find section start
+        # Find section start/end
         section_start = None
         section_end = None
         for i, line in enumerate(lines):
@@ -297,65 +476,127 @@ class ContextManager:
         if len(new_lines) > self.max_context_lines:
             print(f"[ContextManager] Warning: {context} context exceeds {self.max_context_lines} lines")
 
-        # Write back
-        path.write_text("\n".join(new_lines))
+        # Patch the first 'Last Updated' line of the new text (which may sit
+        # inside the replaced section) so the file is written once
+        text = "\n".join(new_lines)
+        marker = "**Last Updated:**"
+        if text.startswith(marker):
+            idx = 0
+        else:
+            idx = text.find("\n" + marker)
+            if idx != -1:
+                idx += 1
+        if idx != -1:
+            end = text.find("\n", idx)
+            if end == -1:
+                end = len(text)
+            text = f"{text[:idx]}**Last Updated:** {_today_str()}{text[end:]}"
 
-        # Update timestamp
-        self._update_timestamp(path)
+        # Write back
+        path.write_text(text)
+        self._invalidate_cache(path)
 
         return True
 
-    def _update_timestamp(self, path: Path):
-        """Update the 'Last Updated' timestamp in a context file."""
-        content = path.read_text()
-        lines = content.split("\n")
+    def _get_models(self):
+        """Get the app.models module, importing it once."""
+        if self._models is None:
+            from app import models
+            self._models = models
+        return self._models
 
-        for i, line in enumerate(lines):
-            if line.startswith("**Last Updated:**"):
-                lines[i] = f"**Last Updated:** {datetime.now().strftime('%B %d, %Y')}"
-                break
+    def _commit_batched(self):
+        """Flush the current write and commit once the batch is full or stale.
 
-        path.write_text("\n".join(lines))
+        A deferred write is committed by a timer at most commit_interval later.
+        """
+        self.db.flush()
+        self._pending += 1
+        if (self._pending >= self.commit_batch_size
+                or time.monotonic() - self._last_flush > self.commit_interval):
+            self.flush_pending()
+        elif self._commit_timer is None:
+            self._commit_timer = threading.Timer(self.commit_interval, self.flush_pending)
+            self._commit_timer.daemon = True
+            self._commit_timer.start()
+
+    @_db_locked
+    def flush_pending(self):
+        """Commit any writes deferred by batching."""
+        if self._commit_timer is not None:
+            self._commit_timer.cancel()
+            self._commit_timer = None
+        if self.db and self._pending:
+            self.db.commit()
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
+    @_db_locked
     def create_snapshot(self, context: str, trigger: str = "manual") -> Dict:
         """Create a snapshot of a context's current state."""
-        content = self.read_context_file(context)
+        entry = self._load_context_file(context)
+        content = entry[1] if entry else None
 
         snapshot = {
             "context": context,
             "trigger": trigger,
             "timestamp": datetime.now().isoformat(),
-            "line_count": len(content.split("\n")) if content else 0,
+            "line_count": entry[2] if entry else 0,
             "content_preview": content[:1000] if content else None,
         }
 
         if self.db:
-            from app.models import Snapshot
-            db_snapshot = Snapshot(
+            m = self._get_models()
+            db_snapshot = m.Snapshot(
                 context=context,
                 data={"content": content},
                 summary=f"Snapshot from {trigger}",
                 trigger=trigger,
             )
             self.db.add(db_snapshot)
-            self.db.commit()
+            self._commit_batched()
             snapshot["id"] = db_snapshot.id
 
         return snapshot
 
-    def get_unread_messages(self, context: str) -> List[Dict]:
-        """Get unread messages for a context."""
+    @_db_locked
+    def get_unread_messages(self, context: str, limit: Optional[int] = 50) -> List[Dict]:
+        """
+        Get unread messages for a context, highest priority and newest first.
+
+        Args:
+            context: Context to read messages for (also receives "all" broadcasts)
+            limit: Maximum messages to return (None for no limit)
+
+        Expects Index("ix_msg_unread_ordered", "to_context", "read_at", "priority",
+        "created_at") on Message so the ordered LIMIT is served from the index.
+        """
         if not self.db:
             return []
 
-        from app.models import Message
-        messages = self.db.query(Message).filter(
+        from sqlalchemy.orm import load_only
+        Message = self._get_models().Message
+        query = self.db.query(Message).options(load_only(
+            Message.id,
+            Message.from_context,
+            Message.to_context,
+            Message.subject,
+            Message.content,
+            Message.priority,
+            Message.message_type,
+            Message.created_at,
+            Message.read_at,
+        )).filter(
             Message.to_context.in_([context, "all"]),
             Message.read_at.is_(None)
-        ).order_by(Message.priority.desc(), Message.created_at.desc()).all()
+        ).order_by(Message.priority.desc(), Message.created_at.desc())
+
+        if limit is not None:
+            query = query.limit(limit)
 
-        return [m.to_dict() for m in messages]
+        return [m.to_dict() for m in query.all()]
 
+    @_db_locked
     def send_message(
         self,
         from_context: str,
@@ -369,8 +610,7 @@ class ContextManager:
         if not self.db:
             return None
 
-        from app.models import Message
-        message = Message(
+        message = self._get_models().Message(
             from_context=from_context,
             to_context=to_context,
             subject=subject,
@@ -379,10 +619,33 @@ class ContextManager:
             message_type=message_type,
         )
         self.db.add(message)
-        self.db.commit()
+        self._commit_batched()
 
         return message.to_dict()
 
+    @_db_locked
+    def bulk_send_messages(self, messages: List[Dict]) -> int:
+        """
+        Send many messages in a single transaction.
+
+        Args:
+            messages: Dicts of Message fields (from_context, to_context, content, ...)
+
+        Returns:
+            Number of messages written
+        """
+        if not self.db or not messages:
+            return 0
+
+        Message = self._get_models().Message
+        self.db.bulk_save_objects([Message(**m) for m in messages])
+        # Commits these together with any writes still deferred by batching
+        self._pending += len(messages)
+        self.flush_pending()
+
+        return len(messages)
+
+    @_db_locked
     def record_session(
         self,
         session_id: str,
@@ -393,7 +656,8 @@ class ContextManager:
         if not self.db:
             return None
 
-        from app.models import Session, SessionStatus
+        m = self._get_models()
+        Session, SessionStatus = m.Session, m.SessionStatus
 
         existing = self.db.query(Session).filter(
             Session.session_id == session_id
@@ -402,7 +666,7 @@ class ContextManager:
         if existing:
             existing.touch()
             existing.task = task or existing.task
-            self.db.commit()
+            self._commit_batched()
             return existing.to_dict()
 
         session = Session(
@@ -412,16 +676,22 @@ class ContextManager:
             status=SessionStatus.ACTIVE.value,
         )
         self.db.add(session)
-        self.db.commit()
+        self._commit_batched()
 
         return session.to_dict()
 
+    @_db_locked
     def get_active_sessions(self) -> List[Dict]:
-        """Get all active sessions across contexts."""
+        """
+        Get all active sessions across contexts.
+
+        Expects Index("ix_session_active", "status", "last_activity") on Session.
+        """
         if not self.db:
             return []
 
-        from app.models import Session, SessionStatus
+        m = self._get_models()
+        Session, SessionStatus = m.Session, m.SessionStatus
         sessions = self.db.query(Session).filter(
             Session.status == SessionStatus.ACTIVE.value
         ).order_by(Session.last_activity.desc()).all()
@@ -432,15 +702,22 @@ class ContextManager:
         """Check if Mac Mini servers are reachable (for Pocket fallback)."""
         import socket
 
+        now = time.monotonic()
+        if self._mini_status_cache and now - self._mini_status_cache[0] < self.mini_status_ttl:
+            return self._mini_status_cache[1]
+
         try:
-            # Try to connect to Mini's backend port
+            # Try to connect to Mini's backend port (loopback connects are fast)
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
+            sock.settimeout(0.2)
             result = sock.connect_ex(('localhost', 5001))
             sock.close()
-            return result == 0
+            reachable = result == 0
         except Exception:
-            return False
+            reachable = False
+
+        self._mini_status_cache = (now, reachable)
+        return reachable
 
 
 def run_context_watcher(fallback_mode: bool = False):
@@ -450,7 +727,8 @@ def run_context_watcher(fallback_mode: bool = False):
 
     try:
         while True:
-            time.sleep(10)
+            if not manager.tracker.wait_for_activity(timeout=10):
+                continue
             summary = manager.get_activity_summary()
             active = manager.get_active_context()
 
@@ -30,29 +30,128 @@ import os
 import sys
 import time
 import json
+import socket
+import threading
 import argparse
+import socketserver
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent  # Up from context/ to oracle/ to root
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from oracle.context.context_manager import ContextManager, ContextType, ContextPaths
+from oracle.context.context_manager import ContextManager, ContextType, ContextPaths, is_network_fs
 from oracle.context.session_spawner import SessionSpawner, HANDOFF_RULES
-from oracle.context import get_context_ids
+from oracle.context import get_context_ids, clear_cache as clear_registry_cache
+
+# Fast JSON for status/message files (falls back to compact stdlib json)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
 
 
 # P25: All valid contexts loaded from registry
-def _get_all_contexts():
-    """Get all context IDs from registry with fallback."""
-    ids = get_context_ids()
-    return ids if ids else ["oracle", "dev", "dash", "crank", "pocket"]
+@lru_cache(maxsize=1)
+def _get_all_contexts() -> tuple:
+    """Get all context IDs from registry with fallback (cached, see clear_context_cache)."""
+    return tuple(get_context_ids() or ("oracle", "dev", "dash", "crank", "pocket"))
+
+
+@lru_cache(maxsize=1)
+def _get_context_set() -> frozenset:
+    """Valid context IDs as a set, for membership checks."""
+    return frozenset(_get_all_contexts())
 
 
+@lru_cache(maxsize=1)
+def _get_allowed_targets() -> dict:
+    """Contexts each context may send to (oracle is always allowed as a target)."""
+    return {
+        ctx: frozenset(HANDOFF_RULES.get(ctx, {}).get("sends_to", {})) | {"oracle"}
+        for ctx in _get_all_contexts()
+    }
+
+
+def clear_context_cache():
+    """Forget the cached context IDs and handoff targets (call after a registry reload)."""
+    clear_registry_cache()
+    _get_all_contexts.cache_clear()
+    _get_context_set.cache_clear()
+    _get_allowed_targets.cache_clear()
+
+
+# Import-time snapshot, kept for callers importing it; this module uses _get_all_contexts()
 ALL_CONTEXTS = _get_all_contexts()
 
 
+def _now() -> str:
+    """Current local time as a second-resolution ISO string."""
+    return datetime.now().isoformat(timespec="seconds")
+
+
+# Message priority ordering (lower sorts first) and display icons
+_PRIORITY = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+_PRIORITY_ICONS = {"urgent": "🔴", "high": "🟠", "normal": "🟢", "low": "⚪"}
+
+
+def _message_sort_key(msg: dict) -> tuple:
+    """Sort messages by priority, then creation time."""
+    return (_PRIORITY.get(msg["priority"], 2), msg["created_at"])
+
+
+# Directories skipped when counting items for the audit
+AUDIT_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build"})
+
+
+def _scan_entries(paths: list) -> dict:
+    """Map each path to its os.DirEntry (or None), scanning each parent directory once."""
+    by_parent = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+
+    found = {}
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+        for child in children:
+            found[child] = entries.get(child.name)
+    return found
+
+
+def _count_items(path: Path, skip: frozenset = AUDIT_SKIP_DIRS) -> int:
+    """Count files and directories under path, pruning heavy/generated directories."""
+    count = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name in skip:
+                        continue
+                    count += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return count
+
+
 class OracleDaemon:
     """
     Oracle Daemon - Main control center for the media engine.
@@ -66,16 +165,64 @@ class OracleDaemon:
 
     def __init__(self, fallback_mode: bool = False):
         self.fallback_mode = fallback_mode
-        self.context_manager = ContextManager(fallback_mode=fallback_mode)
-        self.session_spawner = SessionSpawner(fallback_mode=fallback_mode)
         self.running = False
 
+        # Set by the file watcher on activity; the main loop blocks on it
+        self._wake = threading.Event()
+        self.heartbeat_interval = 300  # Status refresh even when idle
+        self._last_signature = None
+        self._last_loop_write = 0.0
+
         # Status file for daemon state
-        self.status_file = PROJECT_ROOT / "data" / ".oracle_status.json"
+        self._pid = os.getpid()
+        self._data_dir = PROJECT_ROOT / "data"
+        self.status_file = self._data_dir / ".oracle_status.json"
         self.status_file.parent.mkdir(parents=True, exist_ok=True)
+        self._last_status_hash = None
+        self._last_status_data = {}
+
+        # Live status socket (served while the daemon runs; file is the fallback)
+        self.status_socket = self._data_dir / ".oracle.sock"
+        self._status_server = None
+
+        # Message log (append-only JSONL: message records plus {"op": "read"} patches)
+        self.message_file = self._data_dir / ".oracle_messages.jsonl"
+        self._legacy_message_file = self._data_dir / ".oracle_messages.json"
+
+        # Messages replayed from the log; (inode, bytes consumed) lets reloads read only the new tail
+        self._messages = None
+        self._log_state = None
+        self._patch_count = 0
+        self.compact_interval = 3600
+        self.compact_patch_limit = 500
+        self._last_compact = time.monotonic()
+
+        # Message indexes over the cached list: recipient -> messages, id -> message
+        self._by_ctx = {}
+        self._by_id = {}
+
+        # Outbound message batching (flushed by size, interval, or on stop)
+        self._outbox = []
+        self._outbox_lock = threading.RLock()
+        self._last_flush = time.monotonic()
+        self._flusher = None
+        self.flush_interval = 0.1
+        self.flush_batch_size = 100
+
+    @cached_property
+    def context_manager(self) -> ContextManager:
+        """File watcher/context manager, built on first use (not needed by status/send/rules)."""
+        return ContextManager(
+            fallback_mode=self.fallback_mode,
+            on_activity=lambda *_: self._wake.set(),
+            # Pocket (fallback) and network-mounted checkouts need a polling watcher
+            force_poll=self.fallback_mode or is_network_fs(PROJECT_ROOT),
+        )
 
-        # Message queue file (simple file-based messaging)
-        self.message_file = PROJECT_ROOT / "data" / ".oracle_messages.json"
+    @cached_property
+    def session_spawner(self) -> SessionSpawner:
+        """Session spawner, built on first use (only spawn/prompt/prompts need it)."""
+        return SessionSpawner(fallback_mode=self.fallback_mode)
 
     def start(self, background: bool = False):
         """Start the Oracle daemon."""
@@ -89,25 +236,31 @@ class OracleDaemon:
         print(f"Started at: {datetime.now().isoformat()}")
         print(f"Project root: {PROJECT_ROOT}")
         print(f"Ports: backend={ports['backend']}, frontend={ports['frontend']}")
-        print(f"Contexts: {', '.join(ALL_CONTEXTS)}")
+        print(f"Contexts: {', '.join(_get_all_contexts())}")
         print()
 
         # Start file watching
         self.context_manager.start()
         self.running = True
 
-        # Write status file
+        # Start message flusher
+        self._flusher = threading.Thread(target=self._run_flusher, name="oracle-msg-flush", daemon=True)
+        self._flusher.start()
+
+        # Write status file and serve live status
         self._write_status("running")
+        self._start_status_server()
 
         if background:
             print("[Oracle] Running in background mode")
             return
 
-        # Main loop
+        # Main loop: run on file activity, or on heartbeat when idle
         try:
             while self.running:
                 self._loop_iteration()
-                time.sleep(30)  # Check every 30 seconds
+                self._wake.wait(timeout=self.heartbeat_interval)
+                self._wake.clear()
         except KeyboardInterrupt:
             print("\n[Oracle] Shutting down...")
         finally:
@@ -115,8 +268,13 @@ class OracleDaemon:
 
     def stop(self):
         """Stop the Oracle daemon."""
-        self.context_manager.stop()
+        if "context_manager" in self.__dict__:
+            self.context_manager.stop()
         self.running = False
+        self._wake.set()
+        self.flush_now()
+        self.compact_messages()
+        self._stop_status_server()
         self._write_status("stopped")
         print("[Oracle] Daemon stopped")
 
@@ -126,13 +284,24 @@ class OracleDaemon:
         summary = self.context_manager.get_activity_summary()
         active = self.context_manager.get_active_context()
 
+        # Nothing changed since last iteration: only write on heartbeat
+        signature = (active, tuple(
+            (ctx, data["last_activity"], data["recent_files"]) for ctx, data in summary.items()
+        ))
+        if (signature == self._last_signature
+                and time.monotonic() - self._last_loop_write < self.heartbeat_interval):
+            return
+        self._last_signature = signature
+        self._last_loop_write = time.monotonic()
+
         # Update status
+        now = _now()
         status = {
             "active_context": active,
             "activity": summary,
-            "last_check": datetime.now().isoformat(),
+            "last_check": now,
         }
-        self._write_status("running", status)
+        self._write_status("running", status, now=now)
 
         # Print status if there's activity
         active_contexts = [ctx for ctx, data in summary.items() if data["recent_files"] > 0]
@@ -141,20 +310,93 @@ class OracleDaemon:
             for ctx in active_contexts:
                 print(f"  {ctx}: {summary[ctx]['recent_files']} recent files")
 
-    def _write_status(self, state: str, data: dict = None):
-        """Write daemon status to file."""
+    def _write_status(self, state: str, data: dict = None, now: str = None):
+        """Write daemon status to file (atomic; skipped when state and data are unchanged)."""
+        payload = _dumps({"state": state, "data": data or {}})
+        payload_hash = hash(payload)
+        if payload_hash == self._last_status_hash:
+            return
+
         status = {
             "state": state,
-            "pid": os.getpid(),
-            "updated_at": datetime.now().isoformat(),
+            "pid": self._pid,
+            "updated_at": now or _now(),
             "data": data or {},
         }
-        self.status_file.write_text(json.dumps(status, indent=2))
+        tmp_file = self.status_file.with_suffix(".tmp")
+        tmp_file.write_bytes(_dumps(status))
+        os.replace(tmp_file, self.status_file)
+        self._last_status_hash = payload_hash
+        self._last_status_data = data or {}
+
+    def _live_status(self) -> dict:
+        """Current in-memory status (served over the status socket)."""
+        return {
+            "state": "running" if self.running else "stopped",
+            "pid": self._pid,
+            "updated_at": _now(),
+            "data": self._last_status_data,
+        }
+
+    def _start_status_server(self):
+        """Serve live status on a Unix domain socket (no-op where unsupported)."""
+        if not hasattr(socket, "AF_UNIX"):
+            return
+
+        daemon = self
+
+        class StatusHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                self.request.sendall(_dumps(daemon._live_status()))
+
+        try:
+            # Remove a stale socket left by a crashed daemon
+            self.status_socket.unlink(missing_ok=True)
+            self._status_server = socketserver.ThreadingUnixStreamServer(str(self.status_socket), StatusHandler)
+        except OSError as e:
+            print(f"[Oracle] Status socket unavailable ({e}), using status file only")
+            self._status_server = None
+            return
+
+        self._status_server.daemon_threads = True
+        threading.Thread(
+            target=self._status_server.serve_forever, name="oracle-status", daemon=True
+        ).start()
+
+    def _stop_status_server(self):
+        """Shut down the status socket server and remove the socket file."""
+        if self._status_server is None:
+            return
+        self._status_server.shutdown()
+        self._status_server.server_close()
+        self._status_server = None
+        self.status_socket.unlink(missing_ok=True)
+
+    def _query_status_socket(self):
+        """Ask a running daemon for live status; None if no daemon is listening."""
+        if not hasattr(socket, "AF_UNIX") or not self.status_socket.exists():
+            return None
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1.0)
+                sock.connect(str(self.status_socket))
+                chunks = []
+                while True:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return _loads(b"".join(chunks))
+        except (OSError, ValueError):
+            return None
 
     def get_status(self) -> dict:
-        """Get daemon status."""
+        """Get daemon status (live from the running daemon, else from the status file)."""
+        status = self._query_status_socket()
+        if status is not None:
+            return status
         if self.status_file.exists():
-            return json.loads(self.status_file.read_text())
+            return _loads(self.status_file.read_bytes())
         return {"state": "unknown"}
 
     def spawn_session(self, context: str, task: str = None, use_claude: bool = False):
@@ -176,21 +418,24 @@ class OracleDaemon:
         # Without database, just show context activity
         summary = self.context_manager.get_activity_summary()
 
-        print("\n" + "=" * 60)
-        print("ORACLE - Context Activity Summary")
-        print("=" * 60)
+        out = []
+        out.append("\n" + "=" * 60)
+        out.append("ORACLE - Context Activity Summary")
+        out.append("=" * 60)
 
         for ctx, data in summary.items():
             if context and ctx != context:
                 continue
 
-            print(f"\n{ctx.upper()}:")
+            out.append(f"\n{ctx.upper()}:")
             if data["last_activity"]:
-                print(f"  Last activity: {data['last_activity']}")
-                print(f"  Seconds ago: {data['seconds_ago']}")
-                print(f"  Recent files: {data['recent_files']}")
+                out.append(f"  Last activity: {data['last_activity']}")
+                out.append(f"  Seconds ago: {data['seconds_ago']}")
+                out.append(f"  Recent files: {data['recent_files']}")
             else:
-                print("  No recent activity")
+                out.append("  No recent activity")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     def send_message(
         self,
@@ -206,117 +451,206 @@ class OracleDaemon:
         Validates against HANDOFF_RULES to ensure proper communication paths.
         """
         # Validate contexts
-        if from_ctx not in ALL_CONTEXTS or to_ctx not in ALL_CONTEXTS:
-            return {"success": False, "error": f"Invalid context. Must be one of: {ALL_CONTEXTS}"}
+        contexts = _get_context_set()
+        if from_ctx not in contexts or to_ctx not in contexts:
+            return {"success": False, "error": f"Invalid context. Must be one of: {list(_get_all_contexts())}"}
 
         # Check handoff rules (oracle can send to anyone)
-        if from_ctx != "oracle":
+        if from_ctx != "oracle" and to_ctx not in _get_allowed_targets()[from_ctx]:
             allowed = HANDOFF_RULES.get(from_ctx, {}).get("sends_to", {})
-            if to_ctx not in allowed and to_ctx != "oracle":
-                return {
-                    "success": False,
-                    "error": f"{from_ctx} cannot send to {to_ctx}. Allowed: {list(allowed.keys()) + ['oracle']}"
-                }
-
-        # Load existing messages
-        messages = self._load_messages()
-
-        # Create message
-        msg = {
-            "id": len(messages) + 1,
-            "from": from_ctx,
-            "to": to_ctx,
-            "content": content,
-            "type": msg_type,
-            "priority": priority,
-            "created_at": datetime.now().isoformat(),
-            "read_at": None,
-        }
-
-        messages.append(msg)
-        self._save_messages(messages)
+            return {
+                "success": False,
+                "error": f"{from_ctx} cannot send to {to_ctx}. Allowed: {list(allowed.keys()) + ['oracle']}"
+            }
+
+        with self._outbox_lock:
+            messages = self._load_messages()
+
+            # Create message
+            msg = {
+                "id": len(messages) + len(self._outbox) + 1,
+                "from": from_ctx,
+                "to": to_ctx,
+                "content": content,
+                "type": msg_type,
+                "priority": priority,
+                "created_at": datetime.now().isoformat(),
+                "read_at": None,
+            }
+            self._outbox.append(msg)
+
+        # Without a running flusher (one-shot CLI use) write through immediately
+        if len(self._outbox) >= self.flush_batch_size or not (self._flusher and self._flusher.is_alive()):
+            self.flush_now()
 
         print(f"[Oracle] Message sent: {from_ctx} → {to_ctx}")
         return {"success": True, "message": msg}
 
     def _load_messages(self) -> list:
-        """Load messages from file."""
-        if self.message_file.exists():
-            return json.loads(self.message_file.read_text())
-        return []
-
-    def _save_messages(self, messages: list):
-        """Save messages to file."""
-        self.message_file.write_text(json.dumps(messages, indent=2))
+        """Load messages from the log, reading only records appended since the last load."""
+        try:
+            st = self.message_file.stat()
+        except FileNotFoundError:
+            if self._legacy_message_file.exists():
+                self._migrate_legacy_messages()
+                return self._messages
+            self._messages, self._log_state, self._patch_count = [], None, 0
+            self._reindex_messages()
+            return self._messages
+
+        if self._messages is not None and self._log_state and self._log_state[0] == st.st_ino:
+            offset = self._log_state[1]
+            if st.st_size == offset:
+                return self._messages
+            if st.st_size > offset:
+                with open(self.message_file, "rb") as f:
+                    f.seek(offset)
+                    tail = f.read()
+                self._log_state = (st.st_ino, offset + self._apply_records(tail))
+                return self._messages
+
+        # First load, or the log was compacted/replaced: replay it all
+        self._messages, self._patch_count = [], 0
+        self._reindex_messages()
+        self._log_state = (st.st_ino, self._apply_records(self.message_file.read_bytes()))
+        return self._messages
+
+    def _apply_records(self, data: bytes) -> int:
+        """Apply complete JSONL records to the in-memory view; returns bytes consumed."""
+        end = data.rfind(b"\n") + 1  # Ignore a partially written trailing line
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            record = _loads(line)
+            if record.get("op") == "read":
+                msg = self._by_id.get(record["id"])
+                if msg is not None:
+                    msg["read_at"] = record["at"]
+                self._patch_count += 1
+            else:
+                self._messages.append(record)
+                self._index_messages((record,))
+        return end
+
+    def _reindex_messages(self):
+        """Rebuild the recipient and id indexes from the cached messages."""
+        self._by_ctx = {}
+        self._by_id = {}
+        self._index_messages(self._messages)
+
+    def _index_messages(self, messages):
+        """Add messages to the recipient and id indexes."""
+        for msg in messages:
+            self._by_ctx.setdefault(msg["to"], []).append(msg)
+            self._by_id.setdefault(msg["id"], msg)
+
+    def _append_records(self, records: list):
+        """Append records to the log in one write, then pick them up via the tail reader."""
+        self._load_messages()
+        with open(self.message_file, "ab", buffering=0) as f:
+            f.write(b"".join(_dumps(r) + b"\n" for r in records))
+        self._load_messages()
+
+    def _write_log(self, messages: list):
+        """Replace the log with one record per message (atomic)."""
+        tmp_file = self.message_file.with_suffix(".tmp")
+        tmp_file.write_bytes(b"".join(_dumps(m) + b"\n" for m in messages))
+        os.replace(tmp_file, self.message_file)
+        st = self.message_file.stat()
+        self._log_state = (st.st_ino, st.st_size)
+        self._patch_count = 0
+
+    def compact_messages(self):
+        """Rewrite the log from the in-memory view, folding in read patches."""
+        with self._outbox_lock:
+            messages = self._load_messages()
+            if self._patch_count:
+                self._write_log(messages)
+            self._last_compact = time.monotonic()
+
+    def _migrate_legacy_messages(self):
+        """Convert the old JSON-array message file into the JSONL log."""
+        self._messages = _loads(self._legacy_message_file.read_bytes())
+        self._reindex_messages()
+        self._write_log(self._messages)
+        self._legacy_message_file.replace(self._legacy_message_file.with_suffix(".json.bak"))
+
+    def flush_now(self):
+        """Write any buffered outbound messages in a single append."""
+        with self._outbox_lock:
+            if self._outbox:
+                outbox, self._outbox = self._outbox, []
+                self._append_records(outbox)
+            self._last_flush = time.monotonic()
+
+    def _run_flusher(self):
+        """Background thread: flush the outbox every flush_interval, compact the log periodically."""
+        while self.running:
+            time.sleep(self.flush_interval)
+            if self._outbox:
+                self.flush_now()
+            if (self._patch_count >= self.compact_patch_limit
+                    or time.monotonic() - self._last_compact > self.compact_interval):
+                self.compact_messages()
 
     def get_messages_for(self, context: str, unread_only: bool = True) -> list:
         """Get messages for a specific context."""
-        messages = self._load_messages()
-        filtered = [
-            m for m in messages
-            if (m["to"] == context or m["to"] == "all")
-            and (not unread_only or m["read_at"] is None)
-        ]
-        return sorted(filtered, key=lambda x: (
-            {"urgent": 0, "high": 1, "normal": 2, "low": 3}.get(x["priority"], 2),
-            x["created_at"]
-        ))
+        self.flush_now()
+        self._load_messages()
+        candidates = self._by_ctx.get(context, [])
+        if context != "all":
+            candidates = candidates + self._by_ctx.get("all", [])
+        filtered = [m for m in candidates if not unread_only or m["read_at"] is None]
+        filtered.sort(key=_message_sort_key)
+        return filtered
 
     def mark_read(self, message_id: int):
         """Mark a message as read."""
-        messages = self._load_messages()
-        for msg in messages:
-            if msg["id"] == message_id:
-                msg["read_at"] = datetime.now().isoformat()
-                break
-        self._save_messages(messages)
+        with self._outbox_lock:
+            self.flush_now()
+            self._load_messages()
+            if message_id in self._by_id:
+                self._append_records([{"op": "read", "id": message_id, "at": datetime.now().isoformat()}])
 
     def show_handoff_rules(self):
         """Display the handoff rules between contexts."""
-        print("\n" + "=" * 60)
-        print("ORACLE - Cross-Session Handoff Rules")
-        print("=" * 60)
+        out = []
+        out.append("\n" + "=" * 60)
+        out.append("ORACLE - Cross-Session Handoff Rules")
+        out.append("=" * 60)
 
         for ctx, rules in HANDOFF_RULES.items():
-            print(f"\n{ctx.upper()}:")
+            out.append(f"\n{ctx.upper()}:")
 
             sends_to = rules.get("sends_to", {})
             if sends_to:
-                print("  Sends to:")
+                out.append("  Sends to:")
                 for target, msg_types in sends_to.items():
-                    print(f"    → {target}: {', '.join(msg_types)}")
+                    out.append(f"    → {target}: {', '.join(msg_types)}")
 
             receives = rules.get("receives_from", {})
             if receives:
-                print("  Receives from:")
+                out.append("  Receives from:")
                 for source, msg_types in receives.items():
-                    print(f"    ← {source}: {', '.join(msg_types)}")
+                    out.append(f"    ← {source}: {', '.join(msg_types)}")
 
-        print("\n  Note: Oracle can send/receive to/from all contexts")
-        print("=" * 60)
+        out.append("\n  Note: Oracle can send/receive to/from all contexts")
+        out.append("=" * 60)
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     def run_audit(self, quick: bool = False):
         """Run a health audit."""
-        print("\n" + "=" * 60)
-        print("ORACLE - Health Audit")
-        print("=" * 60)
-        print(f"Timestamp: {datetime.now().isoformat()}")
-        print(f"Mode: {'FALLBACK' if self.fallback_mode else 'NORMAL'}")
-        print()
+        out = []
+        out.append("\n" + "=" * 60)
+        out.append("ORACLE - Health Audit")
+        out.append("=" * 60)
+        out.append(f"Timestamp: {datetime.now().isoformat()}")
+        out.append(f"Mode: {'FALLBACK' if self.fallback_mode else 'NORMAL'}")
+        out.append("")
 
         # Check context files (all 5)
-        print("Context Files:")
-        for ctx in ALL_CONTEXTS:
-            path = self.context_manager.get_context_file_path(ctx)
-            if path and path.exists():
-                lines = self.context_manager.get_context_line_count(ctx)
-                status = "⚠️ OVER LIMIT" if lines > 500 else "✓"
-                print(f"  {ctx}: {lines} lines {status}")
-            else:
-                print(f"  {ctx}: ❌ NOT FOUND")
-
-        # Check key directories
-        print("\nKey Directories:")
+        context_paths = {ctx: self.context_manager.get_context_file_path(ctx) for ctx in _get_all_contexts()}
         dirs_to_check = [
             ("app/", "Backend + Frontend (V2)"),
             ("app/frontend/src/", "Frontend code"),
@@ -324,34 +658,56 @@ class OracleDaemon:
             ("config/", "Configuration"),
             ("oracle/docs/context/", "Context files"),
         ]
+        db_path = self._data_dir / "oracle.db"
+
+        # One scandir per parent directory answers every existence check below
+        entries = _scan_entries(
+            [p for p in context_paths.values() if p]
+            + [PROJECT_ROOT / d for d, _ in dirs_to_check]
+            + [db_path]
+        )
+
+        out.append("Context Files:")
+        for ctx in _get_all_contexts():
+            path = context_paths[ctx]
+            if path and entries.get(path) is not None:
+                lines = self.context_manager.get_context_line_count(ctx)
+                status = "⚠️ OVER LIMIT" if lines > 500 else "✓"
+                out.append(f"  {ctx}: {lines} lines {status}")
+            else:
+                out.append(f"  {ctx}: ❌ NOT FOUND")
 
+        # Check key directories
+        out.append("\nKey Directories:")
         for dir_path, desc in dirs_to_check:
             full_path = PROJECT_ROOT / dir_path
-            if full_path.exists():
-                file_count = len(list(full_path.rglob("*")))
-                print(f"  {dir_path}: ✓ ({file_count} items)")
+            if entries.get(full_path) is not None:
+                file_count = _count_items(full_path)
+                out.append(f"  {dir_path}: ✓ ({file_count} items)")
             else:
-                print(f"  {dir_path}: ❌ NOT FOUND")
+                out.append(f"  {dir_path}: ❌ NOT FOUND")
 
         if not quick:
             # Check database
-            print("\nDatabase:")
-            db_path = PROJECT_ROOT / "data" / "oracle.db"
-            if db_path.exists():
-                size_mb = db_path.stat().st_size / (1024 * 1024)
-                print(f"  oracle.db: ✓ ({size_mb:.2f} MB)")
+            out.append("\nDatabase:")
+            db_entry = entries.get(db_path)
+            if db_entry is not None:
+                size_mb = db_entry.stat().st_size / (1024 * 1024)
+                out.append(f"  oracle.db: ✓ ({size_mb:.2f} MB)")
             else:
-                print("  oracle.db: Not found (will be created on first use)")
+                out.append("  oracle.db: Not found (will be created on first use)")
+
+        out.append("\n" + "=" * 60)
 
-        print("\n" + "=" * 60)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def show_prompts(self):
         """Show resume prompts for all contexts."""
         self.session_spawner.print_resume_prompts()
 
 
-def main():
-    """CLI entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full CLI parser."""
     parser = argparse.ArgumentParser(
         description="Oracle Daemon - Media Engine V2 Control Center"
     )
@@ -371,14 +727,14 @@ def main():
 
     # spawn command
     spawn_parser = subparsers.add_parser("spawn", help="Spawn a session")
-    spawn_parser.add_argument("context", choices=ALL_CONTEXTS)
+    spawn_parser.add_argument("context", choices=_get_all_contexts())
     spawn_parser.add_argument("--task", "-t", help="Task description")
     spawn_parser.add_argument("--claude", "-c", action="store_true", help="Use Claude Code")
 
     # send command (cross-session messaging)
     send_parser = subparsers.add_parser("send", help="Send message to another context")
-    send_parser.add_argument("from_ctx", choices=ALL_CONTEXTS, help="Sending context")
-    send_parser.add_argument("to_ctx", choices=ALL_CONTEXTS, help="Receiving context")
+    send_parser.add_argument("from_ctx", choices=_get_all_contexts(), help="Sending context")
+    send_parser.add_argument("to_ctx", choices=_get_all_contexts(), help="Receiving context")
     send_parser.add_argument("content", help="Message content")
     send_parser.add_argument("--type", "-t", default="info",
                             choices=["info", "request", "handoff", "alert"],
@@ -389,7 +745,7 @@ def main():
 
     # messages command
     msg_parser = subparsers.add_parser("messages", help="Show messages")
-    msg_parser.add_argument("--context", "-c", choices=ALL_CONTEXTS, help="Filter by context")
+    msg_parser.add_argument("--context", "-c", choices=_get_all_contexts(), help="Filter by context")
     msg_parser.add_argument("--all", "-a", action="store_true", help="Show all messages (including read)")
 
     # rules command
@@ -404,13 +760,34 @@ def main():
 
     # prompt command (write single prompt to file)
     prompt_parser = subparsers.add_parser("prompt", help="Write prompt to .claude_prompt file")
-    prompt_parser.add_argument("context", choices=ALL_CONTEXTS)
+    prompt_parser.add_argument("context", choices=_get_all_contexts())
     prompt_parser.add_argument("--task", "-t", help="Task description")
 
     # context command
     subparsers.add_parser("context", help="Show active context")
 
-    args = parser.parse_args()
+    return parser
+
+
+# Commands that take no arguments beyond --fallback; dispatched without building argparse
+_FAST_COMMANDS = frozenset({"status", "context", "rules", "prompts"})
+
+
+def _parse_fast(argv: list):
+    """Parse trivial invocations ('status', '-f context', ...) without argparse; None if not trivial."""
+    rest = [arg for arg in argv if arg not in ("--fallback", "-f")]
+    if len(rest) != 1 or rest[0] not in _FAST_COMMANDS:
+        return None
+    return argparse.Namespace(command=rest[0], fallback=len(rest) != len(argv))
+
+
+def main():
+    """CLI entry point."""
+    parser = None
+    args = _parse_fast(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
 
     # Create daemon with fallback mode
     daemon = OracleDaemon(fallback_mode=args.fallback)
@@ -440,18 +817,20 @@ def main():
         if args.context:
             # Show messages for specific context
             messages = daemon.get_messages_for(args.context, unread_only=not args.all)
-            print(f"\n{'=' * 60}")
-            print(f"Messages for {args.context.upper()}")
-            print(f"{'=' * 60}")
+            out = []
+            out.append(f"\n{'=' * 60}")
+            out.append(f"Messages for {args.context.upper()}")
+            out.append(f"{'=' * 60}")
             if messages:
                 for msg in messages:
                     status = "📬" if msg["read_at"] is None else "✓"
-                    priority_icon = {"urgent": "🔴", "high": "🟠", "normal": "🟢", "low": "⚪"}.get(msg["priority"], "")
-                    print(f"\n{status} {priority_icon} [{msg['id']}] From: {msg['from']}")
-                    print(f"   {msg['content']}")
-                    print(f"   ({msg['type']}) - {msg['created_at'][:16]}")
+                    priority_icon = _PRIORITY_ICONS.get(msg["priority"], "")
+                    out.append(f"\n{status} {priority_icon} [{msg['id']}] From: {msg['from']}")
+                    out.append(f"   {msg['content']}")
+                    out.append(f"   ({msg['type']}) - {msg['created_at'][:16]}")
             else:
-                print("\nNo messages")
+                out.append("\nNo messages")
+            sys.stdout.write("\n".join(out) + "\n")
         else:
             daemon.show_messages()
 
@@ -474,7 +853,7 @@ def main():
 
     elif args.command == "context":
         # Quick check without starting daemon
-        manager = ContextManager(fallback_mode=args.fallback)
+        manager = daemon.context_manager
         summary = manager.get_activity_summary()
         print(f"Mode: {'FALLBACK' if args.fallback else 'NORMAL'}")
         print(f"Active context: {manager.get_active_context() or 'None'}")
@@ -483,7 +862,7 @@ def main():
             print(f"  {ctx}: {data['recent_files']} recent files")
 
     else:
-        parser.print_help()
+        (parser or _build_parser()).print_help()
 
 
 if __name__ == "__main__":
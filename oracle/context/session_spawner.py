@@ -17,33 +17,106 @@ Cross-Session Handoffs:
 - Oracle → All: Coordination, health alerts
 """
 
+import base64
+import hashlib
 import os
+import shlex
+import socket
+import sys
 import subprocess
 import json
+import threading
+import time
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 
-# P30: Import Hippocampus for memory integration
+# Optional: orjson for faster registry parsing and message serialization
 try:
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-    from oracle.memory import Hippocampus
-    MEMORY_AVAILABLE = True
+    import orjson
+
+    def _dumps_str(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _dumps_str(obj) -> str:
+        return json.dumps(obj)
+
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Optional: zstandard for compressing large handoff payloads
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
 except ImportError:
-    MEMORY_AVAILABLE = False
+    ZSTD_AVAILABLE = False
+
+# Prefix marking a compressed Message.content value ("ZST:" + base64(zstd(json)))
+COMPRESSED_CONTENT_PREFIX = "ZST:"
+
+
+def encode_handoff_content(content, compress_threshold: Optional[int] = None) -> str:
+    """Serialize handoff content, zstd-compressing it when larger than compress_threshold bytes."""
+    text = _dumps_str(content)
+    if compress_threshold is None or not ZSTD_AVAILABLE or len(text) <= compress_threshold:
+        return text
+
+    packed = zstandard.ZstdCompressor(level=3).compress(text.encode())
+    return COMPRESSED_CONTENT_PREFIX + base64.b64encode(packed).decode("ascii")
+
+
+def decode_handoff_content(text: Optional[str]) -> Optional[str]:
+    """
+    Return the JSON text of a Message.content value, decompressing it if needed.
+
+    Raises RuntimeError for compressed content when zstandard isn't installed.
+    """
+    if not text or not text.startswith(COMPRESSED_CONTENT_PREFIX):
+        return text
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("Handoff content is zstd-compressed but the zstandard package is not installed")
+    packed = base64.b64decode(text[len(COMPRESSED_CONTENT_PREFIX):])
+    return zstandard.ZstdDecompressor().decompress(packed).decode()
+
 
 # Get project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent  # Up from context/ to oracle/ to root
 
 
+REGISTRY_PATH = PROJECT_ROOT / "oracle" / "context" / "context_registry.json"
+
+# Output of headless (claude -p) sessions, one log file per session
+SESSION_LOG_DIR = PROJECT_ROOT / "oracle" / "data" / "sessions"
+
+# Parsed registry and derived handoff rules, reused until the registry's mtime changes
+_REGISTRY_CACHE = {"mtime": None, "data": None}
+_HANDOFF_CACHE = {"mtime": None, "data": None}
+
+
+def _registry_mtime() -> Optional[int]:
+    """Get the registry file's mtime (None if it doesn't exist)."""
+    try:
+        return REGISTRY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 # P25: Registry helper functions (imported from __init__.py)
 def _load_registry() -> Dict:
-    """Load context registry from JSON."""
-    registry_path = PROJECT_ROOT / "oracle" / "context" / "context_registry.json"
-    if registry_path.exists():
-        return json.loads(registry_path.read_text())
-    return {"contexts": [], "handoff_rules": {}, "ports": {}}
+    """Load context registry from JSON (cached by file mtime)."""
+    mtime = _registry_mtime()
+    if mtime is None:
+        return {"contexts": [], "handoff_rules": {}, "ports": {}}
+
+    if _REGISTRY_CACHE["mtime"] != mtime:
+        _REGISTRY_CACHE["data"] = _loads(REGISTRY_PATH.read_bytes())
+        _REGISTRY_CACHE["mtime"] = mtime
+    return _REGISTRY_CACHE["data"]
 
 
 def _get_context_ids() -> List[str]:
@@ -68,7 +141,16 @@ class ContextType:
 
 # P25: Load handoff rules from registry (with fallback to hardcoded)
 def _get_handoff_rules() -> Dict:
-    """Load handoff rules from registry, converting to sends_to/receives_from format."""
+    """Load handoff rules from registry (cached by registry mtime)."""
+    mtime = _registry_mtime()
+    if _HANDOFF_CACHE["data"] is None or _HANDOFF_CACHE["mtime"] != mtime:
+        _HANDOFF_CACHE["data"] = _build_handoff_rules()
+        _HANDOFF_CACHE["mtime"] = mtime
+    return _HANDOFF_CACHE["data"]
+
+
+def _build_handoff_rules() -> Dict:
+    """Build handoff rules from registry, converting to sends_to/receives_from format."""
     registry = _load_registry()
     registry_rules = registry.get("handoff_rules", {})
 
@@ -112,13 +194,14 @@ def _get_handoff_rules() -> Dict:
     # Registry: {"dash": {"to": ["dev", "crank"], "types": [...]}}
     # Internal: {"dash": {"sends_to": {"dev": [...], "crank": [...]}}}
     rules = {}
+    all_ids = [ctx.get("id") for ctx in registry.get("contexts", [])]
     for ctx_id, rule_def in registry_rules.items():
         targets = rule_def.get("to", [])
         types = rule_def.get("types", [])
 
         # Handle "*" as all contexts
         if "*" in targets:
-            targets = [c for c in _get_context_ids() if c != ctx_id]
+            targets = [c for c in all_ids if c != ctx_id]
 
         rules[ctx_id] = {
             "sends_to": {target: types for target in targets}
@@ -127,8 +210,116 @@ def _get_handoff_rules() -> Dict:
     return rules
 
 
+class _HandoffRules(Mapping):
+    """Read-only view of the handoff rules, loaded on first access (not at import)."""
+
+    def __getitem__(self, key):
+        return _get_handoff_rules()[key]
+
+    def __iter__(self):
+        return iter(_get_handoff_rules())
+
+    def __len__(self):
+        return len(_get_handoff_rules())
+
+    def __repr__(self):
+        return repr(_get_handoff_rules())
+
+
 # Lazy-loaded handoff rules
-HANDOFF_RULES = _get_handoff_rules()
+HANDOFF_RULES = _HandoffRules()
+
+# Seconds a formatted memory section is served before it is refreshed
+MEMORY_CACHE_TTL = 30.0
+
+
+@lru_cache(maxsize=64)
+def _base_resume_prompt(context: str, registry_mtime: Optional[int]) -> str:
+    """
+    Build the resume prompt for a context without task or memory sections.
+
+    P25: Registry resume_prompt first, then the detailed fallback prompts.
+    Memoized; registry_mtime is part of the key so registry edits invalidate it.
+    """
+    for ctx in _load_registry().get("contexts", []):
+        if ctx.get("id") == context and ctx.get("resume_prompt"):
+            return ctx["resume_prompt"]
+
+    # Fallback: detailed prompts (project-specific, kept for backward compatibility)
+    base_prompts = {
+        ContextType.ORACLE: """You are Oracle. Read @oracle/docs/context/ORACLE_CONTEXT.md first.
+
+Role: Planning, documentation, health monitoring, cross-session coordination.
+
+Responsibilities:
+- Coordinate Dev, Dash, Crank, Pocket sessions
+- Maintain context files and documentation
+- Run health audits (python oracle/daemon.py audit)
+- Spawn sessions (python oracle/daemon.py spawn <ctx>)
+- Monitor cross-session messages""",
+
+        ContextType.DEV: """You are Dev. Read @oracle/docs/context/DEV_CONTEXT.md first.
+
+Role: Backend development - adapters, services, pipeline, presets.
+
+Scope: app/, scripts/, config/ (NO dashboard/ changes)
+
+Servers: Backend http://localhost:5001/""",
+
+        ContextType.DASH: """You are Dash. Read @oracle/docs/context/DASHBOARD_CONTEXT.md first.
+
+Role: Frontend React development - UI components, API integration.
+
+Scope: dashboard/ only (NO app/ or scripts/ changes)
+
+Servers: Frontend http://localhost:5173/""",
+
+        ContextType.CRANK: """You are Crank. Read @oracle/docs/context/CRANK_CONTEXT.md first.
+
+Role: Content production - generate content using pipeline. NO CODE CHANGES.
+
+Scope: Run pipeline commands, check quality, note bugs for Dev.""",
+
+        ContextType.POCKET: """You are Pocket. Read @oracle/docs/context/POCKET_CONTEXT.md first.
+
+Role: Mobile/backup on M1 MacBook Air. Fallback if Mac Mini crashes.
+
+Normal Mode: Read-only access, light tasks, mobile work
+Fallback Mode: Full server operation if Mini is down""",
+    }
+
+    return base_prompts.get(context, f"Read @oracle/docs/context/{context.upper()}_CONTEXT.md")
+
+
+def _popen_detached(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    log_path: Optional[Path] = None
+) -> subprocess.Popen:
+    """Start a process in its own session with no inherited std streams or fds.
+
+    stdout/stderr are discarded unless log_path is given, in which case both
+    are appended to that file.
+    """
+    if log_path is None:
+        out = subprocess.DEVNULL
+    else:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        out = open(log_path, "ab")
+    try:
+        return subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL,
+            stdout=out,
+            stderr=subprocess.STDOUT if log_path is not None else subprocess.DEVNULL,
+            close_fds=True,
+        )
+    finally:
+        # The child holds its own copy of the fd
+        if log_path is not None:
+            out.close()
 
 
 class SessionSpawner:
@@ -148,11 +339,43 @@ class SessionSpawner:
         spawner.send_handoff(ContextType.DASH, ContextType.DEV, "custom_preset_request", {...})
     """
 
-    def __init__(self, db_session=None, fallback_mode: bool = False):
+    def __init__(
+        self,
+        db_session=None,
+        fallback_mode: bool = False,
+        compress_threshold: Optional[int] = None,
+        use_memory: bool = True
+    ):
         self.db = db_session
         self.project_root = PROJECT_ROOT
         self.fallback_mode = fallback_mode
 
+        # Handoff content larger than this many bytes is stored zstd-compressed
+        # (None = never). Only enable when every reader of Message.content
+        # decodes it with decode_handoff_content().
+        self.compress_threshold = compress_threshold
+
+        # app.models, imported on first database use
+        self._models = None
+
+        # P30: Hippocampus is imported and constructed on first memory lookup
+        # (None = not tried yet, False = unavailable)
+        self._hippo = None
+
+        # P30: Memory lookups can be switched off (--no-memory / ORACLE_NO_MEMORY=1);
+        # also turned off once Hippocampus turns out to be unavailable
+        self._memory_enabled = use_memory and os.environ.get("ORACLE_NO_MEMORY") != "1"
+
+        # Formatted memory sections: (context, days_back) -> (monotonic time, text).
+        # Served for MEMORY_CACHE_TTL seconds, then returned stale while a
+        # background thread refreshes them.
+        self._memory_cache: Dict[tuple, tuple] = {}
+        self._memory_refreshing = set()
+        self._memory_lock = threading.Lock()
+
+        # blake2b digest of the last prompt written to .claude_prompt
+        self._last_prompt_hash: Optional[bytes] = None
+
         # P25: Load configuration from registry
         registry = _load_registry()
         context_path = registry.get("context_path", "oracle/docs/context/")
@@ -166,6 +389,11 @@ class SessionSpawner:
                 self.context_files[ctx_id] = self.project_root / context_path / ctx.get("file", f"{ctx_id.upper()}_CONTEXT.md")
                 self.session_prefixes[ctx_id] = ctx.get("prefix", ctx_id[0].upper())
 
+        # Invariant paths and their string forms, computed once
+        self._project_root_str = str(self.project_root)
+        self._prompt_file_path = self.project_root / ".claude_prompt"
+        self._context_files_str = {ctx_id: str(path) for ctx_id, path in self.context_files.items()}
+
         # Server ports from registry (normal vs fallback)
         self.server_ports = registry.get("ports", {
             "normal": {"backend": 5001, "frontend": 5173},
@@ -175,29 +403,56 @@ class SessionSpawner:
         # Active ports based on mode
         self.ports = self.server_ports.get("fallback" if fallback_mode else "normal", {"backend": 5001, "frontend": 5173})
 
+        # Flattened handoff rules: one set membership test per validation
+        self._allowed_handoffs = frozenset(
+            (source, target, message_type)
+            for source, rules in _get_handoff_rules().items()
+            for target, types in rules.get("sends_to", {}).items()
+            for message_type in types
+        )
+
     def get_next_session_id(self, context: str) -> str:
         """Generate next session ID for a context."""
         prefix = self.session_prefixes.get(context, "S")
 
         if self.db:
-            from app.models import Session
-            sessions = self.db.query(Session).filter(
-                Session.context == context
-            ).all()
+            Session = self._get_models().Session
+            from sqlalchemy import Integer, cast, func
 
-            max_num = 0
-            for s in sessions:
-                try:
-                    num = int(s.session_id.replace(prefix, ""))
-                    max_num = max(max_num, num)
-                except ValueError:
-                    pass
+            # Let the database compute the max numeric suffix instead of
+            # loading every session row for the context.
+            max_num = self.db.query(
+                func.max(cast(func.substr(Session.session_id, len(prefix) + 1), Integer))
+            ).filter(
+                Session.context == context,
+                Session.session_id.like(f"{prefix}%")
+            ).scalar()
 
-            return f"{prefix}{max_num + 1}"
+            return f"{prefix}{(max_num or 0) + 1}"
 
         return f"{prefix}{datetime.now().strftime('%H%M')}"
 
-    def _get_memory_context(self, context: str, days_back: int = 3, limit: int = 5) -> str:
+    def _get_models(self):
+        """Get the app.models module, importing it once."""
+        if self._models is None:
+            from app import models
+            self._models = models
+        return self._models
+
+    def _get_hippo(self):
+        """Get the shared Hippocampus instance, importing it on first use (None if unavailable)."""
+        if self._hippo is None:
+            try:
+                if str(PROJECT_ROOT) not in sys.path:
+                    sys.path.insert(0, str(PROJECT_ROOT))
+                from oracle.memory import Hippocampus
+                self._hippo = Hippocampus()
+            except Exception:
+                self._hippo = False
+                self._memory_enabled = False
+        return self._hippo or None
+
+    def _get_memory_context(self, context: str, days_back: int = 3) -> str:
         """
         Get relevant memory context for resume prompt (P30).
 
@@ -207,71 +462,108 @@ class SessionSpawner:
         Args:
             context: Context name (oracle, dev, dash, etc.)
             days_back: Days to search back (default: 3)
-            limit: Max observations to include (default: 5)
 
         Returns:
             Formatted memory section for resume prompt, or empty string if unavailable
         """
-        if not MEMORY_AVAILABLE:
-            return ""
+        cached = self._memory_cache.get((context, days_back))
+        if cached is None:
+            return self._get_memory_context_bulk([context], days_back=days_back).get(context, "")
+
+        cached_at, memory = cached
+        if time.monotonic() - cached_at >= MEMORY_CACHE_TTL:
+            self._refresh_memory_async(context, days_back)
+        return memory
+
+    def _refresh_memory_async(self, context: str, days_back: int):
+        """Refresh a stale memory section in the background (one refresh per key)."""
+        key = (context, days_back)
+        with self._memory_lock:
+            if key in self._memory_refreshing:
+                return
+            self._memory_refreshing.add(key)
+
+        def refresh():
+            try:
+                self._get_memory_context_bulk([context], days_back=days_back)
+            finally:
+                with self._memory_lock:
+                    self._memory_refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _get_memory_context_bulk(self, contexts: List[str], days_back: int = 3) -> Dict[str, str]:
+        """
+        Get memory context sections for several contexts at once.
 
-        try:
-            hippo = Hippocampus()
+        One batched observation query covers every context, and pattern
+        detection (which is context independent) runs once instead of per context.
 
-            # Normalize context name (capitalize for consistency with observations)
-            context_normalized = context.capitalize()
+        Returns:
+            {context: formatted memory section}; contexts without memory are omitted
+        """
+        hippo = self._get_hippo()
+        if hippo is None:
+            return {}
 
-            # Get recent high-value observations
-            # Priority: decisions > session events > file changes
-            memory_lines = []
+        try:
+            # Normalize context names (capitalize for consistency with observations)
+            normalized = {context: context.capitalize() for context in contexts}
 
-            # 1. Recent decisions for this context
-            decisions = hippo.search(
-                query="",
-                context=context_normalized,
-                observation_type="decision",
-                days_back=days_back,
-                limit=3
-            )
-            if decisions:
-                memory_lines.append("Recent Decisions:")
-                for obs in decisions[:2]:  # Top 2
-                    memory_lines.append(f"  • {obs.get('summary')}")
-
-            # 2. Session events (completions, milestones)
-            sessions = hippo.search(
-                query="",
-                context=context_normalized,
-                observation_type="session_event",
+            # Priority: decisions > session events > file changes
+            observations = hippo.search_multi(
+                contexts=list(set(normalized.values())),
+                types=["decision", "session_event"],
                 days_back=days_back,
-                limit=3
+                limit_per_type=2  # Top 2 of each are shown
             )
-            if sessions:
-                if memory_lines:
-                    memory_lines.append("")
-                memory_lines.append("Recent Sessions:")
-                for obs in sessions[:2]:  # Top 2
-                    memory_lines.append(f"  • {obs.get('summary')}")
 
-            # 3. File changes (most active files)
+            # File changes (most active files)
             patterns = hippo.detect_patterns(days_back=days_back)
             file_patterns = [p for p in patterns if p.pattern_type == "repeated_file"]
-            if file_patterns:
+
+            result = {}
+            for context, context_normalized in normalized.items():
+                by_type = observations.get(context_normalized, {})
+                memory_lines = []
+
+                # 1. Recent decisions for this context
+                decisions = by_type.get("decision")
+                if decisions:
+                    memory_lines.append("Recent Decisions:")
+                    for obs in decisions[:2]:  # Top 2
+                        memory_lines.append(f"  • {obs.get('summary')}")
+
+                # 2. Session events (completions, milestones)
+                sessions = by_type.get("session_event")
+                if sessions:
+                    if memory_lines:
+                        memory_lines.append("")
+                    memory_lines.append("Recent Sessions:")
+                    for obs in sessions[:2]:  # Top 2
+                        memory_lines.append(f"  • {obs.get('summary')}")
+
+                # 3. Active files
+                if file_patterns:
+                    if memory_lines:
+                        memory_lines.append("")
+                    memory_lines.append("Active Files:")
+                    for pattern in file_patterns[:3]:  # Top 3
+                        file_path = pattern.description.split(": ")[1] if ": " in pattern.description else "unknown"
+                        memory_lines.append(f"  • {file_path} ({pattern.occurrence_count}x)")
+
                 if memory_lines:
-                    memory_lines.append("")
-                memory_lines.append("Active Files:")
-                for pattern in file_patterns[:3]:  # Top 3
-                    file_path = pattern.description.split(": ")[1] if ": " in pattern.description else "unknown"
-                    memory_lines.append(f"  • {file_path} ({pattern.occurrence_count}x)")
+                    result[context] = "\n\n---\n🧠 Memory Context (last " + str(days_back) + " days):\n" + "\n".join(memory_lines) + "\n---"
 
-            if memory_lines:
-                return "\n\n---\n🧠 Memory Context (last " + str(days_back) + " days):\n" + "\n".join(memory_lines) + "\n---"
+            now = time.monotonic()
+            for context in contexts:
+                self._memory_cache[(context, days_back)] = (now, result.get(context, ""))
 
-            return ""
+            return result
 
         except Exception as e:
             # Silently fail if memory system not available
-            return ""
+            return {}
 
     def get_resume_prompt(self, context: str, task: str = None, include_memory: bool = True) -> str:
         """Generate a resume prompt for a context.
@@ -288,72 +580,13 @@ class SessionSpawner:
         if not context_file:
             return f"Unknown context: {context}"
 
-        # P25: Check registry for resume_prompt first
-        registry = _load_registry()
-        for ctx in registry.get("contexts", []):
-            if ctx.get("id") == context:
-                resume_prompt = ctx.get("resume_prompt")
-                if resume_prompt:
-                    prompt = resume_prompt
-                    if task:
-                        prompt += f"\n\nCurrent task: {task}"
-                    # P30: Add memory context if available
-                    if include_memory:
-                        memory = self._get_memory_context(context)
-                        if memory:
-                            prompt += memory
-                    return prompt
-
-        # Fallback: detailed prompts (project-specific, kept for backward compatibility)
-        base_prompts = {
-            ContextType.ORACLE: """You are Oracle. Read @oracle/docs/context/ORACLE_CONTEXT.md first.
-
-Role: Planning, documentation, health monitoring, cross-session coordination.
-
-Responsibilities:
-- Coordinate Dev, Dash, Crank, Pocket sessions
-- Maintain context files and documentation
-- Run health audits (python oracle/daemon.py audit)
-- Spawn sessions (python oracle/daemon.py spawn <ctx>)
-- Monitor cross-session messages""",
-
-            ContextType.DEV: """You are Dev. Read @oracle/docs/context/DEV_CONTEXT.md first.
-
-Role: Backend development - adapters, services, pipeline, presets.
-
-Scope: app/, scripts/, config/ (NO dashboard/ changes)
-
-Servers: Backend http://localhost:5001/""",
-
-            ContextType.DASH: """You are Dash. Read @oracle/docs/context/DASHBOARD_CONTEXT.md first.
-
-Role: Frontend React development - UI components, API integration.
-
-Scope: dashboard/ only (NO app/ or scripts/ changes)
-
-Servers: Frontend http://localhost:5173/""",
-
-            ContextType.CRANK: """You are Crank. Read @oracle/docs/context/CRANK_CONTEXT.md first.
-
-Role: Content production - generate content using pipeline. NO CODE CHANGES.
-
-Scope: Run pipeline commands, check quality, note bugs for Dev.""",
-
-            ContextType.POCKET: """You are Pocket. Read @oracle/docs/context/POCKET_CONTEXT.md first.
-
-Role: Mobile/backup on M1 MacBook Air. Fallback if Mac Mini crashes.
-
-Normal Mode: Read-only access, light tasks, mobile work
-Fallback Mode: Full server operation if Mini is down""",
-        }
-
-        prompt = base_prompts.get(context, f"Read @oracle/docs/context/{context.upper()}_CONTEXT.md")
+        prompt = _base_resume_prompt(context, _registry_mtime())
 
         if task:
             prompt += f"\n\nCurrent task: {task}"
 
         # P30: Add memory context if available
-        if include_memory:
+        if include_memory and self._memory_enabled:
             memory = self._get_memory_context(context)
             if memory:
                 prompt += memory
@@ -367,10 +600,64 @@ Fallback Mode: Full server operation if Mini is down""",
         P30: Optionally includes memory context from Hippocampus.
         """
         prompt = self.get_resume_prompt(context, task, include_memory=include_memory)
-        prompt_file = self.project_root / ".claude_prompt"
-        prompt_file.write_text(prompt)
+        prompt_file = self._prompt_file_path
+
+        # Skip the write when the prompt is unchanged since our last write
+        data = prompt.encode()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self._last_prompt_hash and prompt_file.exists():
+            return prompt_file
+
+        # Atomic replace so a reading VS Code task never sees a partial file
+        tmp_file = prompt_file.with_suffix(".tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, prompt_file)
+        self._last_prompt_hash = digest
         return prompt_file
 
+    def _open_in_vscode(self, folder: Path, file: Path, new_window: bool = True) -> bool:
+        """
+        Open a folder + file via the VS Code CLI socket ($VSCODE_IPC_HOOK_CLI).
+
+        Returns True if VS Code accepted the request, False if the socket is
+        unavailable (caller should fall back to the `code` command).
+        """
+        ipc_hook = os.environ.get("VSCODE_IPC_HOOK_CLI")
+        if not ipc_hook or not hasattr(socket, "AF_UNIX"):
+            return False
+
+        body = json.dumps({
+            "type": "open",
+            "folderURIs": [Path(folder).resolve().as_uri()],
+            "fileURIs": [Path(file).resolve().as_uri()],
+            "forceNewWindow": new_window,
+            "forceReuseWindow": not new_window,
+        }).encode()
+        request = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+            b"Connection: close\r\n\r\n" + body
+        )
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(2.0)
+                sock.connect(ipc_hook)
+                sock.sendall(request)
+                status_line = sock.recv(1024).split(b"\r\n", 1)[0]
+        except OSError:
+            return False
+
+        parts = status_line.split()
+        return len(parts) >= 2 and parts[1] == b"200"
+
     def spawn(
         self,
         context: str,
@@ -397,25 +684,30 @@ Fallback Mode: Full server operation if Mini is down""",
         if wait:
             cmd.append("-w")
 
-        cmd.extend([str(self.project_root), str(context_file)])
+        context_file_str = self._context_files_str[context]
+        cmd.extend([self._project_root_str, context_file_str])
 
         result = {
             "session_id": session_id,
             "context": context,
             "task": task,
-            "context_file": str(context_file),
+            "context_file": context_file_str,
             "prompt_file": str(prompt_file),
             "command": " ".join(cmd),
             "spawned_at": datetime.now().isoformat(),
         }
 
         try:
-            subprocess.Popen(cmd, start_new_session=True)
+            # Ask a running VS Code over its CLI socket first; the `code`
+            # wrapper (shell + node bootstrap) is only needed as a fallback.
+            if wait or not self._open_in_vscode(self.project_root, context_file, new_window):
+                _popen_detached(cmd, cwd=self._project_root_str)
             result["success"] = True
             print(f"[SessionSpawner] Prompt written to .claude_prompt")
 
             if self.db:
-                from app.models import Session, SessionStatus
+                m = self._get_models()
+                Session, SessionStatus = m.Session, m.SessionStatus
                 session = Session(
                     session_id=session_id,
                     context=context,
@@ -438,9 +730,17 @@ Fallback Mode: Full server operation if Mini is down""",
         self,
         context: str,
         task: str = None,
-        model: str = "opus"
+        model: str = "opus",
+        headless: bool = False
     ) -> Dict:
-        """Spawn a new Claude Code session with the correct context."""
+        """
+        Spawn a new Claude Code session with the correct context.
+
+        By default claude is started in a new Terminal.app window. With
+        headless=True it is exec'd directly in the background (no shell, no
+        osascript) and its output is written to a per-session log file,
+        returned as result["log_file"].
+        """
         session_id = self.get_next_session_id(context)
         resume_prompt = self.get_resume_prompt(context, task)
 
@@ -456,18 +756,31 @@ Fallback Mode: Full server operation if Mini is down""",
         }
 
         try:
-            terminal_cmd = f'''
-            osascript -e 'tell application "Terminal"
-                do script "cd \\"{self.project_root}\\" && {" ".join(cmd)}"
-                activate
-            end tell'
-            '''
-
-            subprocess.Popen(terminal_cmd, shell=True, start_new_session=True)
+            if not headless:
+                # Pass the (shell-quoted) command line as an osascript argument
+                # instead of interpolating it into the script source.
+                shell_cmd = f"cd {shlex.quote(self._project_root_str)} && {shlex.join(cmd)}"
+                _popen_detached(
+                    [
+                        "osascript",
+                        "-e", "on run argv",
+                        "-e", 'tell application "Terminal"',
+                        "-e", "do script (item 1 of argv)",
+                        "-e", "activate",
+                        "-e", "end tell",
+                        "-e", "end run",
+                        shell_cmd,
+                    ]
+                )
+            else:
+                log_path = SESSION_LOG_DIR / f"{session_id}.log"
+                _popen_detached(cmd, cwd=self._project_root_str, log_path=log_path)
+                result["log_file"] = str(log_path)
             result["success"] = True
 
             if self.db:
-                from app.models import Session, SessionStatus
+                m = self._get_models()
+                Session, SessionStatus = m.Session, m.SessionStatus
                 session = Session(
                     session_id=session_id,
                     context=context,
@@ -508,56 +821,113 @@ Fallback Mode: Full server operation if Mini is down""",
         Returns:
             Message dict if successful, None otherwise
         """
-        # Validate handoff is allowed
-        rules = HANDOFF_RULES.get(from_context, {})
-        allowed_types = rules.get("sends_to", {}).get(to_context, [])
+        sent = self.send_handoffs_bulk([(from_context, to_context, message_type, content, priority)])
+        return sent[0] if sent else None
+
+    def send_handoffs_bulk(self, handoffs: List[tuple]) -> List[Dict]:
+        """
+        Send several cross-session handoff messages in one transaction.
+
+        Args:
+            handoffs: Tuples of (from_context, to_context, message_type, content[, priority])
+
+        Returns:
+            Message dicts for the handoffs that were sent (invalid ones are skipped)
+        """
+        valid = []
+        for handoff in handoffs:
+            from_context, to_context, message_type, content = handoff[:4]
+            priority = handoff[4] if len(handoff) > 4 else "normal"
 
-        if message_type not in allowed_types:
-            print(f"[SessionSpawner] Invalid handoff: {from_context} cannot send {message_type} to {to_context}")
-            return None
+            # Validate handoff is allowed
+            if (from_context, to_context, message_type) not in self._allowed_handoffs:
+                print(f"[SessionSpawner] Invalid handoff: {from_context} cannot send {message_type} to {to_context}")
+                continue
+
+            valid.append((from_context, to_context, message_type, content, priority))
+
+        if not valid:
+            return []
 
         if not self.db:
             print("[SessionSpawner] No database connection - cannot send message")
-            return None
+            return []
 
-        from app.models import Message
+        Message = self._get_models().Message
 
-        message = Message(
-            from_context=from_context,
-            to_context=to_context,
-            message_type=message_type,
-            subject=f"[{message_type}] from {from_context}",
-            content=json.dumps(content),
-            priority=priority,
-        )
-        self.db.add(message)
+        messages = [
+            Message(
+                from_context=from_context,
+                to_context=to_context,
+                message_type=message_type,
+                subject=f"[{message_type}] from {from_context}",
+                content=encode_handoff_content(content, self.compress_threshold),
+                priority=priority,
+            )
+            for from_context, to_context, message_type, content, priority in valid
+        ]
+        # add_all rather than bulk_save_objects: callers need the generated ids
+        self.db.add_all(messages)
         self.db.commit()
 
-        print(f"[SessionSpawner] Handoff sent: {from_context} → {to_context}: {message_type}")
-        return message.to_dict()
+        for from_context, to_context, message_type, _, _ in valid:
+            print(f"[SessionSpawner] Handoff sent: {from_context} → {to_context}: {message_type}")
+
+        # Same content shape as get_pending_handoffs_bulk (decoded JSON text)
+        sent = []
+        for m in messages:
+            message = m.to_dict()
+            message["content"] = decode_handoff_content(message.get("content"))
+            sent.append(message)
+        return sent
 
     def get_pending_handoffs(self, context: str) -> List[Dict]:
         """Get pending handoff messages for a context."""
-        if not self.db:
-            return []
+        return self.get_pending_handoffs_bulk([context])[context]
 
-        from app.models import Message
+    def get_pending_handoffs_bulk(self, contexts: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get pending handoff messages for several contexts with one query.
+
+        Returns:
+            {context: [message dicts, highest priority / newest first]}
+        """
+        result = {context: [] for context in contexts}
+        if not self.db or not contexts:
+            return result
+
+        Message = self._get_models().Message
 
         messages = self.db.query(Message).filter(
-            Message.to_context == context,
+            Message.to_context.in_(contexts),
             Message.read_at.is_(None)
-        ).order_by(Message.priority.desc(), Message.created_at.desc()).all()
+        ).order_by(Message.to_context, Message.priority.desc(), Message.created_at.desc()).all()
 
-        return [m.to_dict() for m in messages]
+        for m in messages:
+            message = m.to_dict()
+            message["content"] = decode_handoff_content(message.get("content"))
+            result[m.to_context].append(message)
+
+        return result
 
     def acknowledge_handoff(self, message_id: int) -> bool:
-        """Mark a handoff message as acknowledged."""
+        """
+        Mark a handoff message as acknowledged.
+
+        Returns False if the message doesn't exist or was already acknowledged
+        (read_at is left untouched then).
+        """
         if not self.db:
             return False
 
-        from app.models import Message
+        Message = self._get_models().Message
 
-        message = self.db.query(Message).filter(Message.id == message_id).first()
+        # Go through Message.acknowledge() so the model owns what
+        # acknowledging sets (read_at and its timestamp convention)
+        message = self.db.query(Message).filter(
+            Message.id == message_id,
+            Message.read_at.is_(None)
+        ).first()
         if message:
             message.acknowledge()
             self.db.commit()
@@ -569,7 +939,7 @@ Fallback Mode: Full server operation if Mini is down""",
         if not self.db:
             return []
 
-        from app.models import Session
+        Session = self._get_models().Session
 
         query = self.db.query(Session)
         if context:
@@ -585,7 +955,7 @@ Fallback Mode: Full server operation if Mini is down""",
         if not self.db:
             return False
 
-        from app.models import Session
+        Session = self._get_models().Session
 
         session = self.db.query(Session).filter(
             Session.session_id == session_id
@@ -599,30 +969,42 @@ Fallback Mode: Full server operation if Mini is down""",
 
     def print_resume_prompts(self):
         """Print resume prompts for all contexts."""
-        print("\n" + "=" * 60)
-        print("SESSION RESUME PROMPTS")
-        print("=" * 60)
+        out = ["", "=" * 60, "SESSION RESUME PROMPTS", "=" * 60]
 
-        for context in ContextType.all():
-            print(f"\n{'=' * 20} {context.upper()} {'=' * 20}")
-            print(self.get_resume_prompt(context))
+        contexts = ContextType.all()
+        memory = self._get_memory_context_bulk(contexts) if self._memory_enabled else {}
+
+        for context in contexts:
+            out.append(f"\n{'=' * 20} {context.upper()} {'=' * 20}")
+            out.append(self.get_resume_prompt(context, include_memory=False) + memory.get(context, ""))
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     def print_handoff_rules(self):
         """Print cross-session handoff rules."""
-        print("\n" + "=" * 60)
-        print("CROSS-SESSION HANDOFF RULES")
-        print("=" * 60)
+        out = ["", "=" * 60, "CROSS-SESSION HANDOFF RULES", "=" * 60]
 
-        for context, rules in HANDOFF_RULES.items():
-            print(f"\n{context.upper()}:")
+        for context, rules in _get_handoff_rules().items():
+            out.append(f"\n{context.upper()}:")
             if rules.get("sends_to"):
-                print("  Sends to:")
+                out.append("  Sends to:")
                 for target, types in rules["sends_to"].items():
-                    print(f"    → {target}: {', '.join(types)}")
+                    out.append(f"    → {target}: {', '.join(types)}")
             if rules.get("receives_from"):
-                print("  Receives from:")
+                out.append("  Receives from:")
                 for source, types in rules["receives_from"].items():
-                    print(f"    ← {source}: {', '.join(types)}")
+                    out.append(f"    ← {source}: {', '.join(types)}")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def _context_arg(value: str) -> str:
+    """argparse type for --context; reads the registry only when the flag is given."""
+    contexts = ContextType.all()
+    if value not in contexts:
+        import argparse
+        raise argparse.ArgumentTypeError(f"invalid choice: {value!r} (choose from {', '.join(contexts)})")
+    return value
 
 
 def main():
@@ -631,14 +1013,16 @@ def main():
 
     parser = argparse.ArgumentParser(description="Spawn VS Code/Claude Code sessions")
     parser.add_argument("action", choices=["spawn", "prompts", "list", "handoffs", "rules"], help="Action")
-    parser.add_argument("--context", "-c", choices=ContextType.all(), help="Context type")
+    parser.add_argument("--context", "-c", type=_context_arg, help="Context type")
     parser.add_argument("--task", "-t", help="Task description")
     parser.add_argument("--claude", action="store_true", help="Use Claude Code")
     parser.add_argument("--model", default="opus", help="Claude model")
+    parser.add_argument("--headless", action="store_true", help="Run Claude Code in the background, logging to oracle/data/sessions/")
+    parser.add_argument("--no-memory", action="store_true", help="Skip Hippocampus memory in resume prompts")
 
     args = parser.parse_args()
 
-    spawner = SessionSpawner()
+    spawner = SessionSpawner(use_memory=not args.no_memory)
 
     if args.action == "spawn":
         if not args.context:
@@ -646,7 +1030,7 @@ def main():
             return
 
         if args.claude:
-            result = spawner.spawn_with_claude(args.context, args.task, args.model)
+            result = spawner.spawn_with_claude(args.context, args.task, args.model, headless=args.headless)
         else:
             result = spawner.spawn(args.context, args.task)
 
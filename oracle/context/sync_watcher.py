@@ -24,10 +24,17 @@ import json
 import time
 import hashlib
 import argparse
+import queue
 import re
+import signal
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -40,11 +47,85 @@ try:
 except ImportError:
     MEMORY_ENABLED = False
 
-# Sync log location
+# Optional: xxhash for faster change-detection hashes
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional: orjson for faster (de)serialization of the log, hashes and status
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Event-driven watching (inotify/FSEvents via watchdog); polling if unavailable
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Watcher state: file hashes, status and sync log in one SQLite database (WAL)
+STATE_DB_PATH = PROJECT_ROOT / "data" / ".oracle_state.sqlite"
+
+STATE_TABLES = """
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER,
+    hash TEXT
+);
+CREATE TABLE IF NOT EXISTS status (
+    k TEXT PRIMARY KEY,
+    v TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_log (
+    ts TEXT,
+    path TEXT,
+    change_type TEXT,
+    context TEXT,
+    details TEXT,
+    synced INTEGER DEFAULT 0,
+    PRIMARY KEY (ts, path)
+);
+CREATE INDEX IF NOT EXISTS idx_sync_log_synced ON sync_log(synced);
+"""
+
+# Earlier JSON state files, imported into STATE_DB_PATH once and renamed to *.bak
 SYNC_LOG_PATH = PROJECT_ROOT / "data" / ".context_sync_log.json"
 WATCHER_STATUS_PATH = PROJECT_ROOT / "data" / ".sync_watcher_status.json"
 FILE_HASHES_PATH = PROJECT_ROOT / "data" / ".file_hashes.json"
 
+# Change-detection hash: blake2b (default), xxh3 (needs xxhash), or any hashlib name
+HASH_ALGO = os.environ.get("ORACLE_HASH", "blake2b")
+if HASH_ALGO == "xxh3" and not XXHASH_AVAILABLE:
+    HASH_ALGO = "blake2b"
+
+
+def _new_hasher():
+    """Create an empty hash object for HASH_ALGO."""
+    if HASH_ALGO == "xxh3":
+        return xxhash.xxh3_64()
+    if HASH_ALGO == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(HASH_ALGO)
+
+
 # Watched paths
 CONTEXT_DOCS_DIR = PROJECT_ROOT / "oracle" / "docs" / "context"
 WATCHED_CODE_DIRS = [
@@ -59,6 +140,47 @@ WATCHED_CODE_DIRS = [
 CONTEXT_DOC_PATTERN = "*.md"
 CODE_EXTENSIONS = {".py", ".js", ".jsx", ".ts", ".tsx", ".json", ".yaml", ".yml"}
 
+# Context doc mapping (file stem -> context)
+_CONTEXT_MAP = {
+    "oracle_context": "oracle",
+    "dev_context": "dev",
+    "dashboard_context": "dash",
+    "crank_context": "crank",
+    "pocket_context": "pocket",
+}
+
+# Slicing str(path) by this gives the project-relative path without relative_to()
+_PROJECT_ROOT_STR_LEN = len(str(PROJECT_ROOT)) + 1
+
+
+@lru_cache(maxsize=4096)
+def _context_from_path_str(rel_path: str) -> Optional[str]:
+    """Extract context name from a project-relative path."""
+    name = os.path.splitext(os.path.basename(rel_path))[0].lower()
+    if name in _CONTEXT_MAP:
+        return _CONTEXT_MAP[name]
+
+    # Code directory mapping
+    path_str = "/" + rel_path
+    if "/app/frontend/" in path_str:
+        return "dash"
+    elif "/app/" in path_str or "/scripts/" in path_str:
+        return "dev"
+    elif "/oracle/" in path_str:
+        return "oracle"
+
+    return None
+
+
+# Context doc header fields (both live in the first few lines)
+HEADER_RE = re.compile(
+    r'\*\*(?:Session:\*\*\s*(?P<session>\w+\d+)|Last Updated:\*\*\s*(?P<last_updated>[^\n]+))'
+)
+CONTEXT_DOC_HEADER_BYTES = 4096
+
+# Events for a path are coalesced until it has been quiet this long
+DEBOUNCE_SECONDS = 0.2
+
 # Ignore patterns
 IGNORE_PATTERNS = {
     "__pycache__",
@@ -71,16 +193,91 @@ IGNORE_PATTERNS = {
     "*.log",
 }
 
+# IGNORE_PATTERNS split by what they match: the directory walk prunes
+# DIR_IGNORE, and _should_ignore checks a path with a few set lookups
+DIR_IGNORE = frozenset({"__pycache__", "node_modules", ".git", "venv", ".venv"})
+NAME_IGNORE = frozenset({".DS_Store", ".env"})
+SUFFIX_IGNORE = frozenset({".pyc", ".log"})
+
+
+if WATCHDOG_AVAILABLE:
+    class SyncEventHandler(FileSystemEventHandler):
+        """Routes file system events for individual files to the SyncWatcher."""
+
+        def __init__(self, watcher: "SyncWatcher"):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            if event.event_type == "deleted":
+                self.watcher._queue_event(Path(event.src_path), deleted=True)
+            elif event.event_type == "moved":
+                self.watcher._queue_move(Path(event.src_path), Path(event.dest_path))
+            elif event.event_type in ("created", "modified", "closed"):
+                self.watcher._queue_event(Path(event.src_path))
+
 
 class SyncWatcher:
     """
     Watches for file changes and logs them for Oracle sync.
     """
 
+    # Full rescan interval in event mode (safety net for missed events)
+    rescan_interval = 600
+
+    # Scans hash changed files on a thread pool above this many files
+    parallel_hash_threshold = 64
+
+    # Sync-log entries are buffered and written by a flusher thread
+    flush_interval = 0.5
+    flush_batch_size = 64
+    # Newest sync-log rows kept; older ones are dropped on each write
+    max_log_entries = 100
+    memory_batch_size = 64
+    # Scans / event batches between status-file checkpoints
+    status_flush_ticks = 30
+
     def __init__(self):
-        self.file_hashes: Dict[str, str] = {}
+        # path -> {"mtime": st_mtime_ns, "size": st_size, "hash": content hash}
+        self.file_hashes: Dict[str, Dict] = {}
+        # Directory listings from earlier scans: dir -> st_mtime_ns, and
+        # dir -> (file paths, subdirectory paths). A directory's mtime only
+        # moves when entries are added, removed or renamed in it.
+        self._dir_mtimes: Dict[str, int] = {}
+        self._dir_to_files: Dict[str, tuple] = {}
         self.running = False
+        self.tick_count = 0
+        self.change_count = 0
+        self.last_tick_at: Optional[str] = None
+        self._lock = threading.RLock()
+        self._observer = None
+        self._stop_event = threading.Event()
+        self.backend = "poll"
+
+        # Buffered sync-log records; _flush_lock keeps batches in order
+        self._log_queue = deque()
+        self._log_cv = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+
+        # Debounced file events: path -> (last event time, "changed" | "deleted"),
+        # plus pending renames dest -> src
+        self._pending: Dict[str, tuple] = {}
+        self._moves: Dict[str, str] = {}
+        self._pending_lock = threading.Lock()
+        self._debouncer = None
+
+        # Hippocampus rows, written in batches by the memory worker thread
+        self._mem_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._mem_worker = None
+
+        # One connection shared by all threads, serialized by _db_lock
+        self._db_lock = threading.RLock()
         self._ensure_data_dir()
+        self._db = self._connect_state()
+        self._migrate_legacy_state()
         self._load_hashes()
 
         # Initialize Hippocampus memory capture (P30 Phase 2)
@@ -94,96 +291,235 @@ class SyncWatcher:
 
     def _ensure_data_dir(self):
         """Ensure data directory exists."""
-        SYNC_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-    def _load_hashes(self):
-        """Load stored file hashes."""
+        STATE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect_state(self) -> sqlite3.Connection:
+        """Open the state database (WAL, so readers never block the watcher)."""
+        conn = sqlite3.connect(str(STATE_DB_PATH), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(STATE_TABLES)
+        return conn
+
+    def _migrate_legacy_state(self):
+        """Import the old JSON hashes and sync log into the state database."""
         if FILE_HASHES_PATH.exists():
+            hashes = self._read_legacy_hashes()
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM file_hashes")
+                self._db.executemany(
+                    "INSERT INTO file_hashes (path, mtime_ns, size, hash) VALUES (?, NULL, NULL, ?)",
+                    hashes.items(),
+                )
+                self._db.execute("INSERT OR REPLACE INTO status (k, v) VALUES ('hash_algo', 'md5')")
+            FILE_HASHES_PATH.replace(FILE_HASHES_PATH.with_suffix(".json.bak"))
+
+        if SYNC_LOG_PATH.exists():
             try:
-                self.file_hashes = json.loads(FILE_HASHES_PATH.read_text())
+                entries = [e for e in _loads(SYNC_LOG_PATH.read_bytes()) if not e.get("synced", False)]
             except json.JSONDecodeError:
-                self.file_hashes = {}
+                entries = []
+            SYNC_LOG_PATH.replace(SYNC_LOG_PATH.with_suffix(".json.bak"))
+            if entries:
+                self._append_log(entries)
 
-    def _save_hashes(self):
-        """Save file hashes."""
-        FILE_HASHES_PATH.write_text(json.dumps(self.file_hashes, indent=2))
+        if WATCHER_STATUS_PATH.exists():
+            WATCHER_STATUS_PATH.unlink()
+
+    @staticmethod
+    def _read_legacy_hashes() -> Dict[str, str]:
+        """Read the old JSON hash file (path -> md5, no stat info)."""
+        try:
+            return _loads(FILE_HASHES_PATH.read_bytes())
+        except json.JSONDecodeError:
+            return {}
+
+    def _append_log(self, records: List[Dict]):
+        """Insert sync-log records in one transaction, keeping the newest max_log_entries."""
+        rows = [
+            (r["timestamp"], r["path"], r["change_type"], r.get("context"),
+             _dumps(r.get("details") or {}).decode(), int(r.get("synced", False)))
+            for r in records
+        ]
+        with self._db_lock, self._db:
+            self._db.executemany(
+                """
+                INSERT OR REPLACE INTO sync_log (ts, path, change_type, context, details, synced)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._db.execute(
+                """
+                DELETE FROM sync_log WHERE rowid NOT IN
+                    (SELECT rowid FROM sync_log ORDER BY ts DESC LIMIT ?)
+                """,
+                (self.max_log_entries,),
+            )
+
+    def _queue_log(self, entry: Dict):
+        """Buffer a sync-log entry (written by the flusher, or at the end of the scan)."""
+        with self._log_cv:
+            self._log_queue.append(entry)
+            if len(self._log_queue) >= self.flush_batch_size:
+                self._log_cv.notify()
+
+    def _flush_sync(self):
+        """Write all buffered sync-log entries now."""
+        with self._flush_lock:
+            with self._log_cv:
+                records = list(self._log_queue)
+                self._log_queue.clear()
+            if records:
+                self._append_log(records)
+
+    def _run_flusher(self):
+        """Flusher thread: drain the log buffer every flush_interval or once a batch is full."""
+        while not self._stop_event.is_set():
+            with self._log_cv:
+                self._log_cv.wait_for(
+                    lambda: len(self._log_queue) >= self.flush_batch_size or self._stop_event.is_set(),
+                    timeout=self.flush_interval,
+                )
+            self._flush_sync()
+
+    def _load_hashes(self):
+        """Load stored file hashes."""
+        with self._db_lock:
+            row = self._db.execute("SELECT v FROM status WHERE k = 'hash_algo'").fetchone()
+            algo = row[0] if row else None
+            self.file_hashes = {
+                path: {"mtime": mtime, "size": size, "hash": digest}
+                for path, mtime, size, digest in self._db.execute(
+                    "SELECT path, mtime_ns, size, hash FROM file_hashes"
+                )
+            }
+
+            if algo != HASH_ALGO:
+                # Hashes from another algorithm can't be compared; drop them and
+                # fall back to (mtime, size) until each file is re-hashed
+                for record in self.file_hashes.values():
+                    record["hash"] = None
+                with self._db:
+                    self._db.execute("UPDATE file_hashes SET hash = NULL")
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO status (k, v) VALUES ('hash_algo', ?)", (HASH_ALGO,)
+                    )
+
+    def _save_hashes(self, changed: Dict[str, Optional[Dict]]):
+        """Persist changed hash records (path -> record, or None if removed) in one transaction."""
+        if not changed:
+            return
+
+        upserts = [
+            (path_key, r["mtime"], r["size"], r["hash"])
+            for path_key, r in changed.items() if r is not None
+        ]
+        deletes = [(path_key,) for path_key, r in changed.items() if r is None]
+        with self._db_lock, self._db:
+            if upserts:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO file_hashes (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+                    upserts,
+                )
+            if deletes:
+                self._db.executemany("DELETE FROM file_hashes WHERE path = ?", deletes)
 
     def _get_file_hash(self, path: Path) -> Optional[str]:
-        """Get MD5 hash of file contents."""
+        """Get a change-detection hash of file contents (HASH_ALGO), streamed in chunks."""
         try:
-            content = path.read_bytes()
-            return hashlib.md5(content).hexdigest()
+            with open(path, "rb") as f:
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    return hashlib.file_digest(f, _new_hasher).hexdigest()
+
+                hasher = _new_hasher()
+                buf = bytearray(65536)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+                return hasher.hexdigest()
         except (IOError, OSError):
             return None
 
-    def _should_ignore(self, path: Path) -> bool:
-        """Check if path should be ignored."""
-        path_str = str(path)
-        for pattern in IGNORE_PATTERNS:
-            if pattern in path_str:
-                return True
-        return False
+    def _stat_record(self, path: Path, path_key: str) -> Optional[Dict]:
+        """
+        Stat a file against its stored record.
 
-    def _get_context_from_path(self, path: Path) -> Optional[str]:
-        """Extract context name from file path."""
-        name = path.stem.lower()
-
-        # Context doc mapping
-        context_map = {
-            "oracle_context": "oracle",
-            "dev_context": "dev",
-            "dashboard_context": "dash",
-            "crank_context": "crank",
-            "pocket_context": "pocket",
-        }
+        Returns the stored record itself when (mtime_ns, size) is unchanged,
+        otherwise a fresh record whose "hash" still has to be filled in.
+        Returns None if the file can't be stat'ed.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
 
-        if name in context_map:
-            return context_map[name]
+        cached = self.file_hashes.get(path_key)
+        if cached and cached["hash"] is not None \
+                and cached["mtime"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached
+
+        return {"mtime": st.st_mtime_ns, "size": st.st_size, "hash": None}
+
+    def _file_record(self, path: Path, path_key: str) -> Optional[Dict]:
+        """
+        Get the {"mtime", "size", "hash"} record for a file.
+
+        The file is only read and hashed when (mtime_ns, size) moved.
+        Returns None if the file can't be stat'ed.
+        """
+        record = self._stat_record(path, path_key)
+        if record is not None and record is not self.file_hashes.get(path_key):
+            record["hash"] = self._get_file_hash(path)
+        return record
+
+    @staticmethod
+    def _content_changed(old: Dict, record: Dict) -> bool:
+        """Compare a stored record with a fresh one."""
+        if old["hash"] is not None:
+            return old["hash"] != record["hash"]
+        # No comparable hash (algorithm changed): judge by (mtime, size) when known
+        return old["mtime"] is not None and (old["mtime"], old["size"]) != (record["mtime"], record["size"])
 
-        # Code directory mapping
-        path_str = str(path)
-        if "/app/frontend/" in path_str:
-            return "dash"
-        elif "/app/" in path_str or "/scripts/" in path_str:
-            return "dev"
-        elif "/oracle/" in path_str:
-            return "oracle"
+    def _should_ignore(self, path: Path) -> bool:
+        """Check if path should be ignored (set lookups on its name and project-relative dirs)."""
+        if path.name in NAME_IGNORE or path.suffix in SUFFIX_IGNORE:
+            return True
+        root_depth = len(PROJECT_ROOT.parts) if path.is_absolute() else 0
+        return not DIR_IGNORE.isdisjoint(path.parts[root_depth:-1])
 
-        return None
+    def _get_context_from_path(self, path: Path) -> Optional[str]:
+        """Extract context name from file path."""
+        return _context_from_path_str(str(path)[_PROJECT_ROOT_STR_LEN:])
 
     def _parse_context_doc(self, path: Path) -> Dict:
         """Parse context doc for session info."""
         try:
-            content = path.read_text()
-
-            # Extract session number
-            session_match = re.search(r'\*\*Session:\*\*\s*(\w+\d+)', content)
-            session = session_match.group(1) if session_match else None
-
-            # Extract last updated
-            updated_match = re.search(r'\*\*Last Updated:\*\*\s*([^\n]+)', content)
-            updated = updated_match.group(1) if updated_match else None
-
-            return {
-                "session": session,
-                "last_updated": updated,
-            }
+            # Only the header is needed
+            with open(path, encoding="utf-8", errors="replace") as f:
+                content = f.read(CONTEXT_DOC_HEADER_BYTES)
+
+            # Session number and last-updated line in one pass (first of each wins)
+            info = {"session": None, "last_updated": None}
+            for match in HEADER_RE.finditer(content):
+                key = match.lastgroup
+                if info[key] is None:
+                    info[key] = match[key]
+                    if info["session"] is not None and info["last_updated"] is not None:
+                        break
+
+            return info
         except (IOError, OSError):
             return {}
 
     def _log_change(self, path: Path, change_type: str, details: Dict = None):
         """Log a file change to sync log."""
-        # Load existing log
-        log_entries = []
-        if SYNC_LOG_PATH.exists():
-            try:
-                log_entries = json.loads(SYNC_LOG_PATH.read_text())
-            except json.JSONDecodeError:
-                log_entries = []
-
         # Create entry
-        rel_path = str(path.relative_to(PROJECT_ROOT))
-        context = self._get_context_from_path(path)
+        rel_path = str(path)[_PROJECT_ROOT_STR_LEN:]
+        context = _context_from_path_str(rel_path)
 
         entry = {
             "timestamp": datetime.now().isoformat(),
@@ -199,121 +535,311 @@ class SyncWatcher:
             doc_info = self._parse_context_doc(path)
             entry["details"].update(doc_info)
 
-        log_entries.append(entry)
+        self._queue_log(entry)
 
-        # Keep last 100 entries
-        if len(log_entries) > 100:
-            log_entries = log_entries[-100:]
+        # Capture to Hippocampus memory (P30 Phase 2), off the event path
+        if self.memory:
+            # Build summary for Layer 1 searches
+            summary = f"{change_type.capitalize()} {path.name}"
+            if context:
+                summary += f" ({context})"
+            session_id = entry["details"].get("session") or "sync_watcher"
+
+            if self._mem_worker is None:
+                self._mem_worker = threading.Thread(
+                    target=self._run_mem_worker, name="sync-watcher-memory", daemon=True
+                )
+                self._mem_worker.start()
+            self._mem_queue.put_nowait((rel_path, change_type, session_id, context or "unknown", summary))
+
+        return entry
 
-        SYNC_LOG_PATH.write_text(json.dumps(log_entries, indent=2))
+    def _run_mem_worker(self):
+        """Memory worker: write queued Hippocampus rows, up to memory_batch_size per transaction."""
+        while True:
+            row = self._mem_queue.get()
+            if row is None:
+                return
+            rows = [row]
+            stop = False
+            while len(rows) < self.memory_batch_size:
+                try:
+                    row = self._mem_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                rows.append(row)
 
-        # Capture to Hippocampus memory (P30 Phase 2)
-        if self.memory:
             try:
-                # Build summary for Layer 1 searches
-                filename = path.name
-                summary = f"{change_type.capitalize()} {filename}"
-                if context:
-                    summary += f" ({context})"
-
-                # Build details for Layer 3
-                details_text = f"File: {rel_path}\nChange: {change_type}\n"
-                if entry["details"].get("session"):
-                    details_text += f"Session: {entry['details']['session']}\n"
-                if entry["details"].get("last_updated"):
-                    details_text += f"Last Updated: {entry['details']['last_updated']}\n"
-
-                # Capture observation
-                session_id = entry["details"].get("session") or "sync_watcher"
-                self.memory.capture_file_change(
-                    file_path=rel_path,
-                    change_type=change_type,
-                    session_id=session_id,
-                    context=context or "unknown",
-                    summary=summary
-                )
+                self.memory.capture_file_change_many(rows)
             except Exception as e:
                 # Don't fail if memory capture fails
                 print(f"Warning: Could not capture to Hippocampus: {e}")
+            if stop:
+                return
+
+    def _scan_directory(self, directory: Path, extensions: set = None,
+                        seen: Optional[set] = None) -> Iterator[Path]:
+        """
+        Yield files under directory, without descending into ignored directories.
+
+        Directories whose mtime hasn't moved since the last scan are not
+        listed again; their cached listing is reused (one stat instead of a
+        scandir). Visited directories are added to seen, if given.
+        """
+        # Listings of directories modified within the last second aren't
+        # cached: a later change in the same mtime tick would go unnoticed
+        racy_after = time.time_ns() - 1_000_000_000
+        stack = [str(directory)]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                mtime = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                continue
+            if seen is not None:
+                seen.add(dir_path)
+
+            cached = self._dir_to_files.get(dir_path)
+            if cached is None or self._dir_mtimes.get(dir_path) != mtime:
+                files, subdirs = [], []
+                try:
+                    entries = os.scandir(dir_path)
+                except OSError:
+                    continue
 
-        return entry
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in DIR_IGNORE:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            ext = os.path.splitext(entry.name)[1]
+                            if entry.name in NAME_IGNORE or ext in SUFFIX_IGNORE:
+                                continue
+                            files.append(entry.path)
+
+                cached = (files, subdirs)
+                if mtime < racy_after:
+                    self._dir_mtimes[dir_path] = mtime
+                    self._dir_to_files[dir_path] = cached
+                else:
+                    self._dir_mtimes.pop(dir_path, None)
+                    self._dir_to_files.pop(dir_path, None)
+
+            files, subdirs = cached
+            stack.extend(subdirs)
+            for file_path in files:
+                if extensions is None or os.path.splitext(file_path)[1] in extensions:
+                    yield Path(file_path)
+
+    def _is_watched_file(self, path: Path) -> bool:
+        """Check if a single path is covered by the watched docs/code dirs."""
+        if path.parent == CONTEXT_DOCS_DIR and path.suffix == ".md":
+            return not self._should_ignore(path)
+        if path.suffix not in CODE_EXTENSIONS or self._should_ignore(path):
+            return False
+        return any(d == path.parent or d in path.parents for d in WATCHED_CODE_DIRS)
+
+    def _handle_event(self, path: Path, deleted: bool = False) -> Optional[Dict]:
+        """Process a change event for one file; returns the logged entry, if any."""
+        if not self._is_watched_file(path):
+            return None
 
-    def _scan_directory(self, directory: Path, extensions: set = None) -> List[Path]:
-        """Scan directory for files."""
-        files = []
+        path_key = str(path.relative_to(PROJECT_ROOT))
+        with self._lock:
+            old = self.file_hashes.get(path_key)
+            record = None if deleted else self._file_record(path, path_key)
+            if record is None:
+                if old is None:
+                    return None
+                del self.file_hashes[path_key]
+                change_type = "deleted"
+            else:
+                if record is old:
+                    return None  # Duplicate event, file untouched
+                self.file_hashes[path_key] = record
+                if old is not None and not self._content_changed(old, record):
+                    self._save_hashes({path_key: record})
+                    return None  # Touched, content unchanged
+                change_type = "modified" if old is not None else "created"
+
+            entry = self._log_change(path, change_type)
+            self._save_hashes({path_key: record})
+            if self._flusher is None:
+                self._flush_sync()
 
-        if not directory.exists():
-            return files
+        return entry
 
-        for item in directory.rglob("*"):
-            if item.is_file() and not self._should_ignore(item):
-                if extensions is None or item.suffix in extensions:
-                    files.append(item)
+    def _handle_rename(self, src: Path, dest: Path) -> List[Dict]:
+        """Process a move; logs a single "renamed" entry when a tracked file moved intact."""
+        if self._is_watched_file(src) and self._is_watched_file(dest):
+            src_key = str(src.relative_to(PROJECT_ROOT))
+            dest_key = str(dest.relative_to(PROJECT_ROOT))
+            with self._lock:
+                old = self.file_hashes.get(src_key)
+                record = self._file_record(dest, dest_key) if old is not None else None
+                if record is not None and old["hash"] is not None and old["hash"] == record["hash"] \
+                        and dest_key not in self.file_hashes:
+                    del self.file_hashes[src_key]
+                    self.file_hashes[dest_key] = record
+                    entry = self._log_change(dest, "renamed", {"from": src_key})
+                    self._save_hashes({src_key: None, dest_key: record})
+                    if self._flusher is None:
+                        self._flush_sync()
+                    return [entry]
+
+        entries = [self._handle_event(src, deleted=True), self._handle_event(dest)]
+        return [e for e in entries if e is not None]
+
+    def _queue_event(self, path: Path, deleted: bool = False):
+        """Record a file event; it is processed once the path has been quiet for DEBOUNCE_SECONDS."""
+        with self._pending_lock:
+            self._pending[str(path)] = (time.monotonic(), "deleted" if deleted else "changed")
+
+    def _queue_move(self, src: Path, dest: Path):
+        """Record a move (MOVED_FROM + MOVED_TO) as one pending rename."""
+        with self._pending_lock:
+            self._moves[str(dest)] = str(src)
+            self._pending.pop(str(src), None)
+            self._pending[str(dest)] = (time.monotonic(), "changed")
+
+    def _process_pending(self, force: bool = False) -> List[Dict]:
+        """Handle debounced events whose path has been quiet long enough (all if force)."""
+        cutoff = time.monotonic() - DEBOUNCE_SECONDS
+        with self._pending_lock:
+            ready = [(p, kind) for p, (ts, kind) in self._pending.items() if force or ts <= cutoff]
+            for path_str, _ in ready:
+                del self._pending[path_str]
+            moves = {p: self._moves.pop(p) for p, _ in ready if p in self._moves}
+
+        if not ready:
+            return []
 
-        return files
+        entries = []
+        for path_str, kind in ready:
+            src = moves.get(path_str)
+            if src is not None:
+                entries.extend(self._handle_rename(Path(src), Path(path_str)))
+            else:
+                entry = self._handle_event(Path(path_str), deleted=(kind == "deleted"))
+                if entry is not None:
+                    entries.append(entry)
+
+        self._print_changes(entries)
+        self._tick(len(entries))
+        return entries
+
+    def _tick(self, changes: int):
+        """Count a scan or event batch; checkpoint the status every status_flush_ticks."""
+        with self._lock:
+            self.tick_count += 1
+            self.change_count += changes
+            self.last_tick_at = datetime.now().isoformat()
+            if self.running and self.tick_count % self.status_flush_ticks == 0:
+                self._write_status("running")
+
+    def _run_debouncer(self):
+        """Debounce thread: every 250ms, process events that have settled."""
+        while not self._stop_event.wait(0.25):
+            self._process_pending()
+
+    def _watch_roots(self) -> List[str]:
+        """Minimal set of existing directories to schedule (nested dirs are covered by parents)."""
+        roots: List[Path] = []
+        for d in sorted({CONTEXT_DOCS_DIR, *WATCHED_CODE_DIRS}, key=lambda p: len(p.parts)):
+            if d.is_dir() and not any(r == d or r in d.parents for r in roots):
+                roots.append(d)
+        return [str(r) for r in roots]
 
     def check_for_changes(self) -> List[Dict]:
         """Check all watched paths for changes."""
+        with self._lock:
+            changes = self._check_for_changes()
+        self._tick(len(changes))
+        return changes
+
+    def _check_for_changes(self) -> List[Dict]:
         changes = []
         current_hashes = {}
+        changed_records: Dict[str, Optional[Dict]] = {}
+
+        # Context docs, then code directories
+        watched = [
+            doc for doc in CONTEXT_DOCS_DIR.glob(CONTEXT_DOC_PATTERN)
+            if not self._should_ignore(doc)
+        ]
+        seen_dirs = set()
+        for code_dir in WATCHED_CODE_DIRS:
+            watched.extend(self._scan_directory(code_dir, CODE_EXTENSIONS, seen_dirs))
+
+        # Forget listings of directories that are gone or no longer reached
+        for dir_path in self._dir_to_files.keys() - seen_dirs:
+            del self._dir_to_files[dir_path]
+            self._dir_mtimes.pop(dir_path, None)
+
+        # Stat everything first, then hash only the files whose stat moved
+        scanned = []
+        to_hash = []
+        for path in watched:
+            path_key = str(path.relative_to(PROJECT_ROOT))
+            record = self._stat_record(path, path_key)
+            if record is None:
+                continue  # Vanished since the scan; handled as deleted below
+            scanned.append((path, path_key, record))
+            if record is not self.file_hashes.get(path_key):
+                to_hash.append((path, record))
+
+        if len(to_hash) > self.parallel_hash_threshold:
+            # Hashing is read I/O plus C code that releases the GIL
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                digests = pool.map(self._get_file_hash, [path for path, _ in to_hash])
+                for (_, record), digest in zip(to_hash, digests):
+                    record["hash"] = digest
+        else:
+            for path, record in to_hash:
+                record["hash"] = self._get_file_hash(path)
 
-        # Check context docs
-        context_docs = list(CONTEXT_DOCS_DIR.glob(CONTEXT_DOC_PATTERN))
-        for doc in context_docs:
-            if self._should_ignore(doc):
-                continue
-
-            path_key = str(doc.relative_to(PROJECT_ROOT))
-            new_hash = self._get_file_hash(doc)
-            current_hashes[path_key] = new_hash
-
-            old_hash = self.file_hashes.get(path_key)
+        for path, path_key, record in scanned:
+            current_hashes[path_key] = record
 
-            if old_hash is None:
+            old = self.file_hashes.get(path_key)
+            if record is not old:
+                changed_records[path_key] = record
+            if old is None:
                 # New file
-                entry = self._log_change(doc, "created")
-                changes.append(entry)
-            elif old_hash != new_hash:
+                changes.append(self._log_change(path, "created"))
+            elif self._content_changed(old, record):
                 # Modified file
-                entry = self._log_change(doc, "modified")
-                changes.append(entry)
-
-        # Check code directories
-        for code_dir in WATCHED_CODE_DIRS:
-            code_files = self._scan_directory(code_dir, CODE_EXTENSIONS)
-
-            for code_file in code_files:
-                if self._should_ignore(code_file):
-                    continue
-
-                path_key = str(code_file.relative_to(PROJECT_ROOT))
-                new_hash = self._get_file_hash(code_file)
-                current_hashes[path_key] = new_hash
-
-                old_hash = self.file_hashes.get(path_key)
-
-                if old_hash is None:
-                    entry = self._log_change(code_file, "created")
-                    changes.append(entry)
-                elif old_hash != new_hash:
-                    entry = self._log_change(code_file, "modified")
-                    changes.append(entry)
+                changes.append(self._log_change(path, "modified"))
 
         # Check for deleted files
         for path_key in list(self.file_hashes.keys()):
             if path_key not in current_hashes:
+                changed_records[path_key] = None
                 full_path = PROJECT_ROOT / path_key
                 entry = self._log_change(full_path, "deleted")
                 changes.append(entry)
 
-        # Update stored hashes
+        # Update stored hashes (only what changed is written)
         self.file_hashes = current_hashes
-        self._save_hashes()
+        self._save_hashes(changed_records)
+        if self._flusher is None:
+            self._flush_sync()
 
         return changes
 
-    def start(self, interval: int = 30, background: bool = False):
-        """Start the watcher loop."""
+    def start(self, interval: int = 30, background: bool = False, poll: bool = False):
+        """
+        Start the watcher loop.
+
+        Args:
+            interval: Seconds between scans in poll mode
+            background: Return after the initial scan (observer keeps running)
+            poll: Skip native file events and rescan every interval (network mounts)
+        """
         print("=" * 60)
         print("ORACLE SYNC WATCHER - File Change Monitor")
         print("=" * 60)
@@ -324,6 +850,21 @@ class SyncWatcher:
         print()
 
         self.running = True
+        self._stop_event.clear()
+
+        self._flusher = threading.Thread(target=self._run_flusher, name="sync-log-flusher", daemon=True)
+        self._flusher.start()
+        if threading.current_thread() is threading.main_thread():
+            if not background:
+                # SIGTERM ends the loop below, whose finally: stop() flushes the log
+                signal.signal(signal.SIGTERM, self._on_sigterm)
+            if hasattr(signal, "SIGUSR1"):
+                # `kill -USR1 <pid>` refreshes the status file on demand
+                signal.signal(signal.SIGUSR1, self._on_sigusr1)
+
+        # Start the observer before the initial scan so no change falls in between
+        if not poll:
+            self._start_observer()
         self._write_status("running")
 
         # Initial scan
@@ -335,27 +876,94 @@ class SyncWatcher:
             print("[Watcher] Running in background mode")
             return
 
+        # Event mode: changes arrive via the observer, the loop only rescans
+        # as a safety net. Poll mode: rescan every interval.
+        wait = self.rescan_interval if self._observer else interval
         try:
-            while self.running:
-                time.sleep(interval)
-                changes = self.check_for_changes()
-
-                if changes:
-                    print(f"\n[Watcher] {datetime.now().strftime('%H:%M:%S')} - {len(changes)} change(s) detected:")
-                    for change in changes:
-                        ctx = change.get("context", "unknown")
-                        print(f"  [{ctx}] {change['change_type']}: {change['path']}")
-                        if change.get("details", {}).get("session"):
-                            print(f"       Session: {change['details']['session']}")
+            while self.running and not self._stop_event.wait(wait):
+                self._print_changes(self.check_for_changes())
 
         except KeyboardInterrupt:
             print("\n[Watcher] Shutting down...")
         finally:
             self.stop()
 
+    def _on_sigterm(self, signum, frame):
+        """SIGTERM handler: ask the main loop to stop (teardown happens there).
+
+        Only sets flags - stop() joins threads and takes non-reentrant locks
+        the interrupted main thread may be holding.
+        """
+        self.running = False
+        self._stop_event.set()
+
+    def _on_sigusr1(self, signum, frame):
+        """SIGUSR1 handler: write the current status (with tick stats)."""
+        # From a thread, so the write can wait for a transaction the main thread is in
+        threading.Thread(
+            target=self._write_status, args=("running" if self.running else "stopped",), daemon=True
+        ).start()
+
+    def _start_observer(self):
+        """Start native file events; falls back to polling if unavailable."""
+        if not WATCHDOG_AVAILABLE:
+            print("[Watcher] Warning: watchdog not installed - falling back to polling")
+            return
+
+        try:
+            observer = Observer()
+            handler = SyncEventHandler(self)
+            for root in self._watch_roots():
+                observer.schedule(handler, root, recursive=True)
+            observer.start()
+        except OSError as e:
+            # e.g. ENOSYS, or "inotify watch limit reached"
+            print(f"[Watcher] Warning: file events unavailable ({e}) - falling back to polling")
+            return
+
+        self._observer = observer
+        self.backend = type(observer).__name__.replace("Observer", "").lower() or "native"
+        self._debouncer = threading.Thread(target=self._run_debouncer, name="sync-debouncer", daemon=True)
+        self._debouncer.start()
+        print(f"[Watcher] Watching for {self.backend} events (full rescan every {self.rescan_interval}s)")
+
+    def _print_changes(self, changes: List[Dict]):
+        """Print a batch of detected changes."""
+        if not changes:
+            return
+        print(f"\n[Watcher] {datetime.now().strftime('%H:%M:%S')} - {len(changes)} change(s) detected:")
+        for change in changes:
+            ctx = change.get("context", "unknown")
+            print(f"  [{ctx}] {change['change_type']}: {change['path']}")
+            if change.get("details", {}).get("session"):
+                print(f"       Session: {change['details']['session']}")
+
     def stop(self):
         """Stop the watcher."""
+        if not self.running and self._observer is None and self._flusher is None \
+                and self._mem_worker is None:
+            return  # Already stopped
+
         self.running = False
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._debouncer is not None:
+            self._debouncer.join()
+            self._debouncer = None
+            self._process_pending(force=True)
+        if self._flusher is not None:
+            with self._log_cv:
+                self._log_cv.notify()
+            self._flusher.join()
+            self._flusher = None
+        self._flush_sync()
+        if self._mem_worker is not None:
+            self._mem_queue.put(None)
+            self._mem_worker.join()
+            self._mem_worker = None
         self._write_status("stopped")
         print("[Watcher] Stopped")
 
@@ -364,45 +972,62 @@ class SyncWatcher:
         status = {
             "state": state,
             "pid": os.getpid(),
+            "backend": self.backend,
             "updated_at": datetime.now().isoformat(),
+            "ticks": self.tick_count,
+            "changes": self.change_count,
+            "last_tick_at": self.last_tick_at,
         }
-        WATCHER_STATUS_PATH.write_text(json.dumps(status, indent=2))
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO status (k, v) VALUES (?, ?)",
+                [(k, _dumps(v).decode()) for k, v in status.items()],
+            )
 
     def get_status(self) -> Dict:
         """Get watcher status."""
-        if WATCHER_STATUS_PATH.exists():
-            try:
-                return json.loads(WATCHER_STATUS_PATH.read_text())
-            except json.JSONDecodeError:
-                pass
-        return {"state": "unknown"}
+        with self._db_lock:
+            rows = self._db.execute("SELECT k, v FROM status WHERE k != 'hash_algo'").fetchall()
+        status = {k: _loads(v) for k, v in rows}
+        return status if "state" in status else {"state": "unknown"}
 
     def get_unsynced_changes(self) -> List[Dict]:
         """Get changes that haven't been synced to Oracle."""
-        if not SYNC_LOG_PATH.exists():
-            return []
-
-        try:
-            entries = json.loads(SYNC_LOG_PATH.read_text())
-            return [e for e in entries if not e.get("synced", False)]
-        except json.JSONDecodeError:
-            return []
+        self._flush_sync()
+        with self._db_lock:
+            rows = self._db.execute(
+                """
+                SELECT ts, path, change_type, context, details
+                FROM sync_log WHERE synced = 0 ORDER BY rowid
+                """
+            ).fetchall()
+        return [
+            {
+                "timestamp": ts,
+                "path": path,
+                "change_type": change_type,
+                "context": context,
+                "details": _loads(details) if details else {},
+                "synced": False,
+            }
+            for ts, path, change_type, context, details in rows
+        ]
 
     def mark_synced(self, before_timestamp: str = None):
-        """Mark entries as synced."""
-        if not SYNC_LOG_PATH.exists():
-            return
-
-        try:
-            entries = json.loads(SYNC_LOG_PATH.read_text())
-
-            for entry in entries:
-                if before_timestamp is None or entry["timestamp"] <= before_timestamp:
-                    entry["synced"] = True
-
-            SYNC_LOG_PATH.write_text(json.dumps(entries, indent=2))
-        except json.JSONDecodeError:
-            pass
+        """
+        Mark entries as synced.
+
+        Synced entries are deleted once they outnumber the unsynced ones.
+        """
+        self._flush_sync()
+        with self._db_lock, self._db:
+            self._db.execute(
+                "UPDATE sync_log SET synced = 1 WHERE synced = 0 AND (? IS NULL OR ts <= ?)",
+                (before_timestamp, before_timestamp),
+            )
+            synced, total = self._db.execute("SELECT SUM(synced), COUNT(*) FROM sync_log").fetchone()
+            if synced and synced * 2 > total:
+                self._db.execute("DELETE FROM sync_log WHERE synced = 1")
 
     def get_context_summary(self) -> Dict:
         """Get summary of changes by context."""
@@ -429,10 +1054,11 @@ class SyncWatcher:
 
     def clear_log(self):
         """Clear the sync log."""
-        if SYNC_LOG_PATH.exists():
-            SYNC_LOG_PATH.unlink()
-        if FILE_HASHES_PATH.exists():
-            FILE_HASHES_PATH.unlink()
+        with self._log_cv:
+            self._log_queue.clear()
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM sync_log")
+            self._db.execute("DELETE FROM file_hashes")
         self.file_hashes = {}
         print("[Watcher] Sync log cleared")
 
@@ -473,7 +1099,11 @@ def show_status():
     print("=" * 60)
     print(f"State: {status.get('state', 'unknown')}")
     print(f"PID: {status.get('pid', 'N/A')}")
+    print(f"Backend: {status.get('backend', 'N/A')}")
     print(f"Last updated: {status.get('updated_at', 'N/A')}")
+    if "ticks" in status:
+        print(f"Ticks: {status['ticks']} ({status.get('changes', 0)} changes, "
+              f"last at {status.get('last_tick_at') or 'N/A'})")
 
     # Show summary
     summary = watcher.get_context_summary()
@@ -492,13 +1122,21 @@ def main():
                         help="Check interval in seconds (default: 30)")
     parser.add_argument("--background", action="store_true",
                         help="Run in background mode")
+    parser.add_argument("--poll", action="store_true",
+                        help="Poll instead of using file events (for network mounts)")
+    parser.add_argument("--poll-interval", type=int,
+                        help="Poll interval in seconds (default: --interval)")
 
     args = parser.parse_args()
 
     watcher = SyncWatcher()
 
     if args.command == "start":
-        watcher.start(interval=args.interval, background=args.background)
+        watcher.start(
+            interval=args.poll_interval or args.interval,
+            background=args.background,
+            poll=args.poll,
+        )
     elif args.command == "status":
         show_status()
     elif args.command == "log":
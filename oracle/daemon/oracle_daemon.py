@@ -19,9 +19,10 @@ Author: Oracle Brain Cell Architecture (P31)
 import os
 import sys
 import time
+import hashlib
 import signal
+import select
 import atexit
-from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict
 import json
@@ -31,6 +32,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from oracle.context.daemon import OracleDaemon
 
+# Health checks (skipped if the maintenance package is unavailable)
+try:
+    from oracle.maintenance.microglia import run_audit
+except ImportError:
+    run_audit = None
+
+# Optional: orjson for the status file
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Log buffering: flush after LOG_BATCH lines or LOG_FLUSH_SEC seconds.
+# ORACLE_LOG_UNBUFFERED=1 writes every line straight through instead.
+LOG_BATCH = 64
+LOG_FLUSH_SEC = 1.0
+LOG_UNBUFFERED = os.environ.get("ORACLE_LOG_UNBUFFERED", "") not in ("", "0")
+
+# Flags for the small unbuffered writes (PID file, log lines, log redirection)
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_CLOEXEC
+
+# restart(): how long to wait for the old daemon after SIGTERM (then SIGKILL)
+RESTART_TIMEOUT = 10.0
+RESTART_POLL = 0.05
+
+# Status details that change on every health check; ignored when deciding
+# whether the status file needs rewriting
+_VOLATILE_DETAILS = frozenset({'last_health_check', 'audit_elapsed'})
+
+# Process names (/proc/<pid>/comm, max 15 chars) a live daemon can have
+_DAEMON_COMMS = ("python", Path(sys.executable).name[:15])
+
 
 class OracleDaemonService:
     """
@@ -62,8 +106,20 @@ class OracleDaemonService:
         self.log_file = self.data_dir / ".oracle_daemon.log"
         self.err_file = self.data_dir / ".oracle_daemon.err"
 
+        # Buffered log lines and the handle they are flushed to (opened in start())
+        self._log_buf: list = []
+        self._log_fh = None
+        self._log_last_flush = time.monotonic()
+        # (epoch second, formatted "[timestamp] " prefix) for the current second
+        self._ts_cache = (0, "")
+
+        # Our PID; refreshed after daemonizing forks
+        self._pid = os.getpid()
+
         # Status file
         self.status_file = self.data_dir / ".oracle_daemon_status.json"
+        self._last_status_digest: Optional[bytes] = None
+        self._last_status_write = 0.0  # time.monotonic() of the last write
 
         # Wrapped daemon instance
         self.daemon: Optional[OracleDaemon] = None
@@ -72,7 +128,11 @@ class OracleDaemonService:
         self.health_check_interval = 300  # 5 minutes
         self.memory_cleanup_interval = 1800  # 30 minutes
 
-        # Tracking
+        # Last quick audit, reused for health_check_interval seconds
+        self._cached_audit = None
+        self._cached_audit_ts = 0.0
+
+        # Tracking (time.monotonic() of the last run)
         self.last_health_check = 0
         self.last_memory_cleanup = 0
         self.start_time = 0
@@ -80,13 +140,20 @@ class OracleDaemonService:
         # Running flag
         self.running = False
 
+        # Self-pipe woken by signal.set_wakeup_fd (see _setup_signal_handlers)
+        self._sig_r: Optional[int] = None
+        self._sig_w: Optional[int] = None
+
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
     def _write_pid_file(self) -> None:
         """Write PID to file."""
-        with open(self.pid_file, 'w') as f:
-            f.write(str(os.getpid()))
+        fd = os.open(self.pid_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_CLOEXEC, 0o644)
+        try:
+            os.write(fd, str(self._pid).encode())
+        finally:
+            os.close(fd)
 
     def _remove_pid_file(self) -> None:
         """Remove PID file."""
@@ -114,12 +181,24 @@ class OracleDaemonService:
         """
         Check if process with given PID is running.
 
+        On Linux this reads /proc/<pid>/comm (no signal involved) and also
+        rejects a PID that was reused by an unrelated, non-Python process.
+
         Args:
             pid: Process ID to check
 
         Returns:
             True if running, False otherwise
         """
+        if sys.platform.startswith('linux'):
+            try:
+                comm = Path(f'/proc/{pid}/comm').read_text().strip()
+            except FileNotFoundError:
+                return False
+            except OSError:
+                return True  # Exists, but we can't inspect it
+            return comm.startswith(_DAEMON_COMMS)
+
         try:
             # Send signal 0 (does nothing, but checks if process exists)
             os.kill(pid, 0)
@@ -162,22 +241,37 @@ class OracleDaemonService:
             sys.stderr.write(f"Fork #2 failed: {e}\n")
             sys.exit(1)
 
+        self._pid = os.getpid()
+
         # Redirect standard file descriptors
         sys.stdout.flush()
         sys.stderr.flush()
 
-        # Open log files
-        with open(self.log_file, 'a') as log_out:
-            with open(self.err_file, 'a') as log_err:
-                os.dup2(log_out.fileno(), sys.stdout.fileno())
-                os.dup2(log_err.fileno(), sys.stderr.fileno())
+        # Point stdout/stderr at the log files (dup2'd fds stay inheritable)
+        log_fd = os.open(self.log_file, _APPEND_FLAGS, 0o644)
+        os.dup2(log_fd, sys.stdout.fileno())
+        os.close(log_fd)
+        err_fd = os.open(self.err_file, _APPEND_FLAGS, 0o644)
+        os.dup2(err_fd, sys.stderr.fileno())
+        os.close(err_fd)
 
         # Write PID file
         atexit.register(self._remove_pid_file)
         self._write_pid_file()
 
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
+        """
+        Setup signal handlers for graceful shutdown.
+
+        The handlers only clear the running flag; the signal number is also
+        written to a self-pipe (set_wakeup_fd) so the main loop wakes up at
+        once and does the actual teardown outside the handler.
+        """
+        if self._sig_r is None:
+            self._sig_r, self._sig_w = os.pipe()
+            os.set_blocking(self._sig_r, False)
+            os.set_blocking(self._sig_w, False)
+        signal.set_wakeup_fd(self._sig_w)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
 
@@ -189,63 +283,173 @@ class OracleDaemonService:
             signum: Signal number
             frame: Current stack frame
         """
-        self._log(f"Received signal {signum}, shutting down gracefully...")
-        self.stop()
-        sys.exit(0)
+        self.running = False
+
+    def _wait(self, timeout: float) -> Optional[bytes]:
+        """
+        Sleep until timeout or a signal arrives.
+
+        Returns:
+            Signal numbers received (as bytes), or None on timeout
+        """
+        ready, _, _ = select.select([self._sig_r], [], [], timeout)
+        if not ready:
+            return None
+        try:
+            return os.read(self._sig_r, 64)
+        except BlockingIOError:
+            return b""
 
     def _log(self, message: str) -> None:
         """
         Write message to log file.
 
+        Lines are buffered once the daemon has started and written by
+        _flush_log; before that (or with ORACLE_LOG_UNBUFFERED) each line
+        is appended directly.
+
         Args:
             message: Message to log
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_message = f"[{timestamp}] {message}\n"
+        now_i = int(time.time())
+        if now_i != self._ts_cache[0]:
+            self._ts_cache = (now_i, time.strftime('[%Y-%m-%d %H:%M:%S] ', time.localtime(now_i)))
+        log_message = f"{self._ts_cache[1]}{message}\n"
+
+        if self._log_fh is None:
+            try:
+                fd = os.open(self.log_file, _APPEND_FLAGS, 0o644)
+                try:
+                    os.write(fd, log_message.encode())
+                finally:
+                    os.close(fd)
+            except Exception:
+                pass  # Silent fail for logging
+            return
+
+        self._log_buf.append(log_message)
+        if len(self._log_buf) >= LOG_BATCH:
+            self._flush_log()
+
+    def _open_log(self) -> None:
+        """Open the persistent log handle used for buffered logging."""
+        if LOG_UNBUFFERED or self._log_fh is not None:
+            return
+        try:
+            self._log_fh = open(self.log_file, 'a', buffering=1 << 16)
+        except Exception:
+            self._log_fh = None  # Fall back to per-line appends
+            return
+        self._log_last_flush = time.monotonic()
+        atexit.register(self._flush_log, True)
+
+    def _flush_log(self, force: bool = False) -> None:
+        """
+        Write buffered log lines.
+
+        Args:
+            force: Flush even if the batch/time thresholds haven't been reached
+        """
+        if not self._log_buf or self._log_fh is None:
+            return
+        now = time.monotonic()
+        if not force and len(self._log_buf) < LOG_BATCH and now - self._log_last_flush < LOG_FLUSH_SEC:
+            return
 
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(log_message)
+            self._log_fh.write("".join(self._log_buf))
+            self._log_fh.flush()
         except Exception:
             pass  # Silent fail for logging
+        self._log_buf.clear()
+        self._log_last_flush = now
 
     def _update_status(self, status: str, details: Optional[Dict] = None) -> None:
         """
         Update daemon status file.
 
+        The file is replaced atomically, and not rewritten when nothing but
+        the timestamps changed since the last write (errors always are), unless
+        that write is older than half a health check interval - so watchers
+        see last_updated advance at least once per interval.
+
         Args:
             status: Status string (running, stopped, error)
             details: Optional additional details
         """
+        details = details or {}
         status_data = {
             'status': status,
-            'pid': os.getpid(),
+            'pid': self._pid,
             'start_time': self.start_time,
             'last_updated': time.time(),
             'project_root': str(self.project_root),
-            'details': details or {}
+            'details': details
         }
 
+        stable = json.dumps(
+            [status, status_data['pid'], self.start_time,
+             {k: v for k, v in details.items() if k not in _VOLATILE_DETAILS}],
+            sort_keys=True, default=str
+        ).encode()
+        digest = hashlib.blake2b(stable, digest_size=8).digest()
+        # Half an interval of slack: health checks are scheduled one interval
+        # apart but write a little later each time (after the audit runs)
+        now = time.monotonic()
+        if (digest == self._last_status_digest and status != 'error'
+                and now - self._last_status_write < self.health_check_interval / 2):
+            return
+
+        tmp_file = self.status_file.with_suffix('.json.tmp')
         try:
-            with open(self.status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
+            payload = _dumps(status_data)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.status_file)
         except Exception as e:
             self._log(f"Failed to update status: {e}")
+            return
+        self._last_status_digest = digest
+        self._last_status_write = now
+
+    def _run_audit_cached(self, force: bool = False):
+        """
+        Run a quick audit, or reuse the last one if it is still fresh.
+
+        Args:
+            force: Always run a new audit (the scheduled health check does)
+
+        Returns:
+            Audit result
+        """
+        if not force and self._cached_audit is not None \
+                and time.monotonic() - self._cached_audit_ts < self.health_check_interval:
+            return self._cached_audit
+
+        self._cached_audit = run_audit(quick=True)
+        self._cached_audit_ts = time.monotonic()
+        return self._cached_audit
 
     def _periodic_health_check(self) -> None:
         """Run periodic health check."""
-        try:
-            from oracle.maintenance.microglia import run_audit
-
-            self._log("Running scheduled health check...")
-            result = run_audit(quick=True)
+        if run_audit is None:
+            return
 
-            self._log(f"Health check complete - Score: {result.health_score}")
+        try:
+            started = time.monotonic()
+            result = self._run_audit_cached(force=True)
+            elapsed = time.monotonic() - started
 
-            # Update status with health info
+            # One log line and one status update per check
+            self._log(f"Health check complete in {elapsed:.2f}s - Score: {result.health_score}")
             self._update_status('running', {
                 'health_score': result.health_score,
-                'last_health_check': time.time()
+                'last_health_check': time.time(),
+                'audit_elapsed': elapsed
             })
 
         except Exception as e:
@@ -291,9 +495,13 @@ class OracleDaemonService:
             self._daemonize()
         else:
             print("🚀 Starting Oracle daemon in foreground...")
+            self._pid = os.getpid()
             self._write_pid_file()
             atexit.register(self._remove_pid_file)
 
+        # Buffered logging from here on (after any fork)
+        self._open_log()
+
         # Setup signal handlers
         self._setup_signal_handlers()
 
@@ -305,13 +513,20 @@ class OracleDaemonService:
         self.start_time = time.time()
 
         # Log startup
-        self._log(f"Daemon started (PID: {os.getpid()}, Background: {background})")
+        self._log(f"Daemon started (PID: {self._pid}, Background: {background})")
+        if run_audit is None:
+            self._log("Health checks disabled (oracle.maintenance.microglia not importable)")
         self._update_status('running', {'background': background})
 
+        # Both scheduled tasks are due right away
+        now = time.monotonic()
+        self.last_health_check = now - self.health_check_interval
+        self.last_memory_cleanup = now - self.memory_cleanup_interval
+
         # Main loop
         try:
             while self.running:
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Run scheduled health check
                 if current_time - self.last_health_check >= self.health_check_interval:
@@ -323,8 +538,18 @@ class OracleDaemonService:
                     self._periodic_memory_cleanup()
                     self.last_memory_cleanup = current_time
 
-                # Sleep for a bit (don't spin loop)
-                time.sleep(30)
+                self._flush_log(force=True)
+
+                # Sleep until the next task is due; a signal wakes us early
+                next_due = min(
+                    self.last_health_check + self.health_check_interval,
+                    self.last_memory_cleanup + self.memory_cleanup_interval,
+                )
+                signals = self._wait(max(0.0, next_due - time.monotonic()))
+                if signals:
+                    self._log(f"Received signal {signals[-1]}, shutting down gracefully...")
+
+            self.stop()
 
         except KeyboardInterrupt:
             self._log("Interrupted by user")
@@ -362,6 +587,7 @@ class OracleDaemonService:
         self._remove_pid_file()
 
         self._log("Daemon stopped")
+        self._flush_log(force=True)
         return True
 
     def status(self) -> Dict:
@@ -391,10 +617,10 @@ class OracleDaemonService:
         # Read status file if available
         if self.status_file.exists():
             try:
-                with open(self.status_file, 'r') as f:
-                    status_data = json.load(f)
-                    status_data['running'] = True
-                    return status_data
+                status_data = _loads(self.status_file.read_bytes())
+                status_data['running'] = True
+                status_data['health_score'] = self._health_score(status_data)
+                return status_data
             except Exception:
                 pass
 
@@ -405,6 +631,36 @@ class OracleDaemonService:
             'message': 'Daemon is running'
         }
 
+    def _health_score(self, status_data: Dict) -> Optional[int]:
+        """
+        Latest health score without auditing again.
+
+        Uses this instance's cached audit while it is fresh, otherwise the
+        score the running daemon recorded at its last health check.
+        """
+        if self._cached_audit is not None \
+                and time.monotonic() - self._cached_audit_ts < self.health_check_interval:
+            return self._cached_audit.health_score
+        return status_data.get('details', {}).get('health_score')
+
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """
+        Poll until a process exits.
+
+        Args:
+            pid: Process ID to wait for
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if the process exited, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._is_running(pid):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(RESTART_POLL)
+        return True
+
     def restart(self) -> bool:
         """
         Restart the daemon.
@@ -419,8 +675,11 @@ class OracleDaemonService:
         if pid and self._is_running(pid):
             try:
                 os.kill(pid, signal.SIGTERM)
-                # Wait for shutdown
-                time.sleep(2)
+                # Wait for shutdown, no longer than needed
+                if not self._wait_for_exit(pid, RESTART_TIMEOUT):
+                    print(f"⚠️  Daemon (PID: {pid}) did not exit, killing it")
+                    os.kill(pid, signal.SIGKILL)
+                    self._wait_for_exit(pid, 1.0)
             except OSError:
                 pass
 
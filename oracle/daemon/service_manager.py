@@ -16,9 +16,72 @@ Author: Oracle Brain Cell Architecture (P31)
 import os
 import sys
 import platform
+import string
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Service file templates, parsed once at import
+_LAUNCHD_TPL = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>${service_id}</string>
+
+    <key>ProgramArguments</key>
+    <array>
+        <string>${python_exe}</string>
+        <string>${daemon_script}</string>
+        <string>start</string>
+        <string>--project-root</string>
+        <string>${project_root}</string>
+        <string>--foreground</string>
+    </array>
+
+    <key>RunAtLoad</key>
+    <true/>
+
+    <key>KeepAlive</key>
+    <dict>
+        <key>Crashed</key>
+        <true/>
+    </dict>
+
+    <key>StandardOutPath</key>
+    <string>${stdout_log}</string>
+
+    <key>StandardErrorPath</key>
+    <string>${stderr_log}</string>
+
+    <key>WorkingDirectory</key>
+    <string>${project_root}</string>
+
+    <key>ProcessType</key>
+    <string>Background</string>
+
+    <key>ThrottleInterval</key>
+    <integer>10</integer>
+</dict>
+</plist>
+""")
+
+_SYSTEMD_TPL = string.Template("""[Unit]
+Description=Oracle Project Intelligence Daemon
+After=network.target
+
+[Service]
+Type=simple
+ExecStart=${python_exe} ${daemon_script} start --project-root ${project_root} --foreground
+Restart=on-failure
+RestartSec=10s
+StandardOutput=append:${stdout_log}
+StandardError=append:${stderr_log}
+WorkingDirectory=${project_root}
+
+[Install]
+WantedBy=default.target
+""")
 
 
 class ServiceManager:
@@ -55,6 +118,43 @@ class ServiceManager:
         self.stdout_log = self.log_dir / ".oracle_daemon.log"
         self.stderr_log = self.log_dir / ".oracle_daemon.err"
 
+        # Platform implementations, resolved once (None if unsupported)
+        self._ops = {
+            "Darwin": {  # macOS
+                "install": self._install_launchd,
+                "uninstall": self._uninstall_launchd,
+                "enable": self._enable_launchd,
+                "disable": self._disable_launchd,
+            },
+            "Linux": {
+                "install": self._install_systemd,
+                "uninstall": self._uninstall_systemd,
+                "enable": self._enable_systemd,
+                "disable": self._disable_systemd,
+            },
+        }.get(self.platform)
+
+    def _unsupported(self) -> bool:
+        """Report an unsupported platform."""
+        print(f"❌ Unsupported platform: {self.platform}")
+        return False
+
+    def _template_values(self) -> Dict[str, str]:
+        """
+        Substitutions for the service file templates.
+
+        Returns:
+            Placeholder name -> value
+        """
+        return {
+            "service_id": self.service_id,
+            "python_exe": self.python_exe,
+            "daemon_script": str(self.daemon_script),
+            "project_root": str(self.project_root),
+            "stdout_log": str(self.stdout_log),
+            "stderr_log": str(self.stderr_log),
+        }
+
     def _generate_launchd_plist(self) -> str:
         """
         Generate launchd plist configuration for macOS.
@@ -62,49 +162,7 @@ class ServiceManager:
         Returns:
             Plist XML content
         """
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{self.service_id}</string>
-
-    <key>ProgramArguments</key>
-    <array>
-        <string>{self.python_exe}</string>
-        <string>{self.daemon_script}</string>
-        <string>start</string>
-        <string>--project-root</string>
-        <string>{self.project_root}</string>
-        <string>--foreground</string>
-    </array>
-
-    <key>RunAtLoad</key>
-    <true/>
-
-    <key>KeepAlive</key>
-    <dict>
-        <key>Crashed</key>
-        <true/>
-    </dict>
-
-    <key>StandardOutPath</key>
-    <string>{self.stdout_log}</string>
-
-    <key>StandardErrorPath</key>
-    <string>{self.stderr_log}</string>
-
-    <key>WorkingDirectory</key>
-    <string>{self.project_root}</string>
-
-    <key>ProcessType</key>
-    <string>Background</string>
-
-    <key>ThrottleInterval</key>
-    <integer>10</integer>
-</dict>
-</plist>
-"""
+        return _LAUNCHD_TPL.substitute(self._template_values())
 
     def _generate_systemd_service(self) -> str:
         """
@@ -113,22 +171,7 @@ class ServiceManager:
         Returns:
             Service file content
         """
-        return f"""[Unit]
-Description=Oracle Project Intelligence Daemon
-After=network.target
-
-[Service]
-Type=simple
-ExecStart={self.python_exe} {self.daemon_script} start --project-root {self.project_root} --foreground
-Restart=on-failure
-RestartSec=10s
-StandardOutput=append:{self.stdout_log}
-StandardError=append:{self.stderr_log}
-WorkingDirectory={self.project_root}
-
-[Install]
-WantedBy=default.target
-"""
+        return _SYSTEMD_TPL.substitute(self._template_values())
 
     def _get_launchd_plist_path(self) -> Path:
         """
@@ -154,26 +197,30 @@ WantedBy=default.target
         systemd_user.mkdir(parents=True, exist_ok=True)
         return systemd_user / f"{self.service_name}.service"
 
-    def install(self) -> bool:
+    def install(self, enable_on_install: bool = False) -> bool:
         """
         Install system service.
 
+        Args:
+            enable_on_install: Also enable and start the service (systemd;
+                launchd services start as soon as they are loaded)
+
         Returns:
             True if successful, False otherwise
         """
-        if self.platform == "Darwin":  # macOS
-            return self._install_launchd()
-        elif self.platform == "Linux":
-            return self._install_systemd()
-        else:
-            print(f"❌ Unsupported platform: {self.platform}")
+        if self._ops is None:
+            self._unsupported()
             print("💡 Supported platforms: macOS (Darwin), Linux")
             return False
+        return self._ops["install"](enable_on_install)
 
-    def _install_launchd(self) -> bool:
+    def _install_launchd(self, enable_on_install: bool = False) -> bool:
         """
         Install launchd service on macOS.
 
+        Args:
+            enable_on_install: Unused; loading the plist already enables and starts it
+
         Returns:
             True if successful, False otherwise
         """
@@ -207,10 +254,13 @@ WantedBy=default.target
             print(f"❌ Failed to install launchd service: {e}")
             return False
 
-    def _install_systemd(self) -> bool:
+    def _install_systemd(self, enable_on_install: bool = False) -> bool:
         """
         Install systemd service on Linux.
 
+        Args:
+            enable_on_install: Enable and start the service in one systemctl call
+
         Returns:
             True if successful, False otherwise
         """
@@ -233,6 +283,18 @@ WantedBy=default.target
             if result.returncode != 0:
                 print(f"⚠️  Failed to reload systemd: {result.stderr}")
 
+            if enable_on_install:
+                result = subprocess.run(
+                    ["systemctl", "--user", "enable", "--now", self.service_name],
+                    capture_output=True,
+                    text=True
+                )
+
+                if result.returncode == 0:
+                    print(f"✅ Enabled and started {self.service_name}")
+                    return True
+                print(f"⚠️  Service file created but not enabled: {result.stderr}")
+
             print(f"💡 To enable auto-start on boot:")
             print(f"   systemctl --user enable {self.service_name}")
             print(f"💡 To start now:")
@@ -251,13 +313,9 @@ WantedBy=default.target
         Returns:
             True if successful, False otherwise
         """
-        if self.platform == "Darwin":  # macOS
-            return self._uninstall_launchd()
-        elif self.platform == "Linux":
-            return self._uninstall_systemd()
-        else:
-            print(f"❌ Unsupported platform: {self.platform}")
-            return False
+        if self._ops is None:
+            return self._unsupported()
+        return self._ops["uninstall"]()
 
     def _uninstall_launchd(self) -> bool:
         """
@@ -307,15 +365,9 @@ WantedBy=default.target
                 print(f"⚠️  Service not installed (service file not found)")
                 return True
 
-            # Stop service
-            subprocess.run(
-                ["systemctl", "--user", "stop", self.service_name],
-                capture_output=True
-            )
-
-            # Disable service
+            # Stop and disable service
             subprocess.run(
-                ["systemctl", "--user", "disable", self.service_name],
+                ["systemctl", "--user", "disable", "--now", self.service_name],
                 capture_output=True
             )
 
@@ -342,30 +394,43 @@ WantedBy=default.target
         Returns:
             True if successful, False otherwise
         """
-        if self.platform == "Darwin":
-            # launchd services are auto-enabled when loaded
-            print(f"✅ launchd service is already enabled")
-            return True
-        elif self.platform == "Linux":
-            try:
-                result = subprocess.run(
-                    ["systemctl", "--user", "enable", self.service_name],
-                    capture_output=True,
-                    text=True
-                )
+        if self._ops is None:
+            return self._unsupported()
+        return self._ops["enable"]()
 
-                if result.returncode == 0:
-                    print(f"✅ Enabled {self.service_name} (will start on boot)")
-                    return True
-                else:
-                    print(f"❌ Failed to enable service: {result.stderr}")
-                    return False
+    def _enable_launchd(self) -> bool:
+        """
+        Enable launchd service on macOS (a no-op: loaded services are enabled).
+
+        Returns:
+            True
+        """
+        print(f"✅ launchd service is already enabled")
+        return True
+
+    def _enable_systemd(self) -> bool:
+        """
+        Enable systemd service on Linux.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            result = subprocess.run(
+                ["systemctl", "--user", "enable", self.service_name],
+                capture_output=True,
+                text=True
+            )
 
-            except Exception as e:
-                print(f"❌ Failed to enable service: {e}")
+            if result.returncode == 0:
+                print(f"✅ Enabled {self.service_name} (will start on boot)")
+                return True
+            else:
+                print(f"❌ Failed to enable service: {result.stderr}")
                 return False
-        else:
-            print(f"❌ Unsupported platform: {self.platform}")
+
+        except Exception as e:
+            print(f"❌ Failed to enable service: {e}")
             return False
 
     def disable(self) -> bool:
@@ -375,44 +440,56 @@ WantedBy=default.target
         Returns:
             True if successful, False otherwise
         """
-        if self.platform == "Darwin":
-            # Unload plist to disable
-            plist_path = self._get_launchd_plist_path()
-            if plist_path.exists():
-                try:
-                    subprocess.run(
-                        ["launchctl", "unload", str(plist_path)],
-                        capture_output=True
-                    )
-                    print(f"✅ Disabled {self.service_id}")
-                    return True
-                except Exception as e:
-                    print(f"❌ Failed to disable service: {e}")
-                    return False
-            else:
-                print(f"⚠️  Service not installed")
-                return True
+        if self._ops is None:
+            return self._unsupported()
+        return self._ops["disable"]()
 
-        elif self.platform == "Linux":
-            try:
-                result = subprocess.run(
-                    ["systemctl", "--user", "disable", self.service_name],
-                    capture_output=True,
-                    text=True
-                )
+    def _disable_launchd(self) -> bool:
+        """
+        Disable launchd service on macOS by unloading its plist.
 
-                if result.returncode == 0:
-                    print(f"✅ Disabled {self.service_name}")
-                    return True
-                else:
-                    print(f"❌ Failed to disable service: {result.stderr}")
-                    return False
+        Returns:
+            True if successful, False otherwise
+        """
+        plist_path = self._get_launchd_plist_path()
+        if not plist_path.exists():
+            print(f"⚠️  Service not installed")
+            return True
+
+        try:
+            subprocess.run(
+                ["launchctl", "unload", str(plist_path)],
+                capture_output=True
+            )
+            print(f"✅ Disabled {self.service_id}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to disable service: {e}")
+            return False
 
-            except Exception as e:
-                print(f"❌ Failed to disable service: {e}")
+    def _disable_systemd(self) -> bool:
+        """
+        Disable systemd service on Linux.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            result = subprocess.run(
+                ["systemctl", "--user", "disable", self.service_name],
+                capture_output=True,
+                text=True
+            )
+
+            if result.returncode == 0:
+                print(f"✅ Disabled {self.service_name}")
+                return True
+            else:
+                print(f"❌ Failed to disable service: {result.stderr}")
                 return False
-        else:
-            print(f"❌ Unsupported platform: {self.platform}")
+
+        except Exception as e:
+            print(f"❌ Failed to disable service: {e}")
             return False
 
 
@@ -425,6 +502,8 @@ def main():
                         help='Service management command')
     parser.add_argument('--project-root', default='.',
                         help='Project root directory')
+    parser.add_argument('--enable', action='store_true',
+                        help='With install: also enable and start the service (systemd)')
 
     args = parser.parse_args()
 
@@ -432,7 +511,7 @@ def main():
     manager = ServiceManager(project_root)
 
     if args.command == 'install':
-        manager.install()
+        manager.install(enable_on_install=args.enable)
     elif args.command == 'uninstall':
         manager.uninstall()
     elif args.command == 'enable':
@@ -20,10 +20,13 @@ import os
 import ast
 import json
 import re
+import time
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 # =============================================================================
 # PATH CONFIGURATION
@@ -42,12 +45,26 @@ SCRIPTS_DIR = LAYERS_DIR  # V2 alias for backward compatibility
 
 # Debug mode
 DEBUG = os.environ.get("ORACLE_DEBUG", "").lower() in ("1", "true", "yes")
-
-def debug_log(msg: str, category: str = "general"):
-    """Print debug message if DEBUG mode is enabled."""
-    if DEBUG:
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+_LOG_FILE = os.environ.get("ORACLE_LOG_FILE")
+
+# Last formatted second for log timestamps: [epoch second, prefix]
+_last_sec = [0, ""]
+_last_log_sec = [0, ""]
+
+
+if DEBUG:
+    def debug_log(msg: str, category: str = "general"):
+        """Print debug message (DEBUG mode is enabled)."""
+        t = time.time()
+        sec = int(t)
+        if sec != _last_sec[0]:
+            _last_sec[0] = sec
+            _last_sec[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+        timestamp = f"{_last_sec[1]}.{int((t - sec) * 1000):03d}"
         print(f"  🔍 [{timestamp}] [{category}] {msg}")
+else:
+    def debug_log(msg: str, category: str = "general"):
+        """No-op: DEBUG mode is disabled."""
 
 # =============================================================================
 # CONFIGURATION CONSTANTS
@@ -204,12 +221,22 @@ def load_oracle_config(config_path: Path = None) -> dict:
     Consolidates config loading used by multiple brain cell modules.
     Priority: explicit path > maintenance/config.json > defaults
 
+    Parsed configs are memoized per resolved path; call
+    ``load_oracle_config.cache_clear()`` to pick up edits.
+
     Args:
         config_path: Optional explicit path to config file
 
     Returns:
         Dict with configuration values
     """
+    key = str(Path(config_path).resolve()) if config_path else "__default__"
+    # Hand out a copy so callers can't mutate the cached entry
+    return dict(_load_oracle_config_cached(key))
+
+
+@lru_cache(maxsize=4)
+def _load_oracle_config_cached(path_str: str) -> dict:
     defaults = {
         "max_reports": MAX_REPORTS,
         "debug": DEBUG,
@@ -218,6 +245,7 @@ def load_oracle_config(config_path: Path = None) -> dict:
     }
 
     # Try explicit path first
+    config_path = None if path_str == "__default__" else Path(path_str)
     if config_path and config_path.exists():
         try:
             with open(config_path) as f:
@@ -237,27 +265,34 @@ def load_oracle_config(config_path: Path = None) -> dict:
     return defaults
 
 
-def get_project_paths() -> dict:
-    """Return standardized project paths dict.
+load_oracle_config.cache_clear = _load_oracle_config_cached.cache_clear
+
+
+_PROJECT_PATHS = MappingProxyType({
+    "project_root": PROJECT_ROOT,
+    "oracle_dir": ORACLE_DIR,
+    "maintenance_dir": MAINTENANCE_DIR,
+    "reports_dir": REPORTS_DIR,
+    "audits_dir": AUDITS_DIR,
+    "layers_dir": LAYERS_DIR,
+    "scripts_dir": SCRIPTS_DIR,
+    "docs_dir": ORACLE_DIR / "docs",
+    "context_dir": ORACLE_DIR / "docs" / "context",
+    "app_dir": PROJECT_ROOT / "app",
+    "config_dir": PROJECT_ROOT / "config",
+})
+
+
+def get_project_paths() -> Mapping[str, Path]:
+    """Return standardized project paths mapping.
 
     Provides consistent path references for all brain cell modules.
+    The mapping is built once at import and is read-only.
 
     Returns:
-        Dict with all standard project paths
+        Mapping with all standard project paths
     """
-    return {
-        "project_root": PROJECT_ROOT,
-        "oracle_dir": ORACLE_DIR,
-        "maintenance_dir": MAINTENANCE_DIR,
-        "reports_dir": REPORTS_DIR,
-        "audits_dir": AUDITS_DIR,
-        "layers_dir": LAYERS_DIR,
-        "scripts_dir": SCRIPTS_DIR,
-        "docs_dir": ORACLE_DIR / "docs",
-        "context_dir": ORACLE_DIR / "docs" / "context",
-        "app_dir": PROJECT_ROOT / "app",
-        "config_dir": PROJECT_ROOT / "config",
-    }
+    return _PROJECT_PATHS
 
 
 def format_debug_output(data, title: str = "", indent: int = 2) -> str:
@@ -273,33 +308,37 @@ def format_debug_output(data, title: str = "", indent: int = 2) -> str:
     Returns:
         Formatted string representation
     """
-    lines = []
+    out = []
 
     if title:
-        lines.append(f"{'=' * 50}")
-        lines.append(f"  {title}")
-        lines.append(f"{'=' * 50}")
+        out.append(f"{'=' * 50}")
+        out.append(f"  {title}")
+        out.append(f"{'=' * 50}")
 
+    _emit(data, indent, out)
+    return "\n".join(out)
+
+
+def _emit(data, indent: int, out: list):
+    """Append formatted lines for ``data`` to ``out`` (no joins)."""
     if isinstance(data, dict):
         for key, value in data.items():
             if isinstance(value, (dict, list)):
-                lines.append(f"{' ' * indent}{key}:")
-                lines.append(format_debug_output(value, indent=indent + 2))
+                out.append(f"{' ' * indent}{key}:")
+                _emit(value, indent + 2, out)
             else:
-                lines.append(f"{' ' * indent}{key}: {value}")
+                out.append(f"{' ' * indent}{key}: {value}")
     elif isinstance(data, list):
         for i, item in enumerate(data[:20]):  # Limit to 20 items
             if isinstance(item, dict):
-                lines.append(f"{' ' * indent}[{i}]:")
-                lines.append(format_debug_output(item, indent=indent + 2))
+                out.append(f"{' ' * indent}[{i}]:")
+                _emit(item, indent + 2, out)
             else:
-                lines.append(f"{' ' * indent}- {item}")
+                out.append(f"{' ' * indent}- {item}")
         if len(data) > 20:
-            lines.append(f"{' ' * indent}... and {len(data) - 20} more")
+            out.append(f"{' ' * indent}... and {len(data) - 20} more")
     else:
-        lines.append(f"{' ' * indent}{data}")
-
-    return "\n".join(lines)
+        out.append(f"{' ' * indent}{data}")
 
 
 def log_to_oracle(message: str, level: str = "info", category: str = "oracle"):
@@ -312,7 +351,15 @@ def log_to_oracle(message: str, level: str = "info", category: str = "oracle"):
         level: Log level ('debug', 'info', 'warning', 'error')
         category: Category tag for filtering
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Only print debug if DEBUG mode enabled
+    if level == "debug" and not DEBUG:
+        return
+
+    sec = int(time.time())
+    if sec != _last_log_sec[0]:
+        _last_log_sec[0] = sec
+        _last_log_sec[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    timestamp = _last_log_sec[1]
 
     level_icons = {
         "debug": "🔍",
@@ -323,17 +370,12 @@ def log_to_oracle(message: str, level: str = "info", category: str = "oracle"):
 
     icon = level_icons.get(level, "•")
 
-    # Only print debug if DEBUG mode enabled
-    if level == "debug" and not DEBUG:
-        return
-
     print(f"{icon} [{timestamp}] [{category}] {message}")
 
     # Optionally write to log file
-    if os.environ.get("ORACLE_LOG_FILE"):
-        log_file = Path(os.environ["ORACLE_LOG_FILE"])
+    if _LOG_FILE:
         try:
-            with open(log_file, "a") as f:
+            with open(_LOG_FILE, "a") as f:
                 f.write(f"[{timestamp}] [{level.upper()}] [{category}] {message}\n")
         except Exception:
             pass
@@ -343,6 +385,22 @@ def log_to_oracle(message: str, level: str = "info", category: str = "oracle"):
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def _write_direct(path: Path, data: bytes) -> None:
+    """Write a whole small file with one os.write (no buffered file object).
+
+    Args:
+        path: File to create or truncate
+        data: Complete file contents
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def write_health_status(health_score: float, critical: int = 0, warnings: int = 0,
                         optimizations: int = 0, cost: float = 0.0):
     """Write health status to shared state file for sEEG monitor.
@@ -367,8 +425,7 @@ def write_health_status(health_score: float, critical: int = 0, warnings: int =
     }
     try:
         status_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(status_file, 'w') as f:
-            json.dump(status, f, indent=2)
+        _write_direct(status_file, json.dumps(status, indent=2).encode())
     except Exception as e:
         debug_log(f"Failed to write health status: {e}", "glial")
 
@@ -387,17 +444,43 @@ def cleanup_old_files(directory: Path, pattern: str, max_keep: int = 5) -> int:
     if not directory.exists():
         return 0
 
-    # Get all matching files sorted by modification time (newest first)
-    files = sorted(directory.glob(pattern), key=lambda f: f.stat().st_mtime, reverse=True)
+    # Matching files by modification time (newest first); files that vanish
+    # between the glob and the stat are skipped
+    stamped = []
+    for f in directory.glob(pattern):
+        try:
+            stamped.append((f.stat().st_mtime, f.name))
+        except OSError:
+            pass
+    stamped.sort(reverse=True)
 
-    # Delete files beyond max_keep
-    deleted = 0
-    for old_file in files[max_keep:]:
+    to_delete = [name for _, name in stamped[max_keep:]]
+    if not to_delete:
+        return 0
+
+    # Delete files beyond max_keep, relative to one open directory fd
+    # (unlinkat) so each unlink skips resolving the full path
+    dir_fd = None
+    if os.unlink in os.supports_dir_fd:
         try:
-            old_file.unlink()
-            deleted += 1
-        except Exception:
-            pass  # Silently ignore deletion errors
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            dir_fd = None
+
+    deleted = 0
+    try:
+        for name in to_delete:
+            try:
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    (directory / name).unlink()
+                deleted += 1
+            except Exception:
+                pass  # Silently ignore deletion errors
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
     return deleted
 
@@ -977,10 +1060,12 @@ class ScriptDebugger:
 
         if self.output_file:
             output_path = Path(self.output_file)
-            with open(output_path, 'w') as f:
-                f.write(f"# Script Debug Trace: {script_path.name}\n")
-                f.write(f"# Generated: {datetime.now().isoformat()}\n\n")
-                f.write("\n".join(self.trace_output))
+            trace = (
+                f"# Script Debug Trace: {script_path.name}\n"
+                f"# Generated: {datetime.now().isoformat()}\n\n"
+                + "\n".join(self.trace_output)
+            )
+            _write_direct(output_path, trace.encode())
             print(f"📄 Trace saved to: {output_path}")
 
         return exit_code
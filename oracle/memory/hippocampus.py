@@ -328,6 +328,67 @@ class Hippocampus:
 
             return results
 
+    def search_multi(
+        self,
+        contexts: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        limit_per_type: int = 3,
+        days_back: int = 30
+    ) -> Dict[str, Dict[str, List[Dict]]]:
+        """
+        Batched Layer 1 search across several contexts and observation types.
+
+        Runs a single query (``context IN (...) AND observation_type IN (...)``)
+        instead of one search() per pair. The per-pair limit is applied in SQL
+        with ROW_NUMBER() (SQLite 3.25+), so only the returned rows are fetched.
+
+        Args:
+            contexts: Contexts to include (None = all)
+            types: Observation types to include (None = all)
+            limit_per_type: Maximum results per (context, type) pair
+            days_back: Only search last N days
+
+        Returns:
+            {context: {observation_type: [observations, newest first]}}
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+
+            sql = """
+                SELECT id, timestamp, session_id, context, observation_type,
+                       summary, file_path, layer_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY context, observation_type
+                           ORDER BY timestamp DESC
+                       ) AS rn
+                FROM observations
+                WHERE timestamp >= datetime('now', '-' || ? || ' days')
+            """
+            params: List[Any] = [days_back]
+
+            if contexts:
+                sql += f" AND context IN ({','.join('?' * len(contexts))})"
+                params.extend(contexts)
+
+            if types:
+                sql += f" AND observation_type IN ({','.join('?' * len(types))})"
+                params.extend(types)
+
+            sql = f"""
+                SELECT id, timestamp, session_id, context, observation_type,
+                       summary, file_path, layer_id
+                FROM ({sql})
+                WHERE rn <= ?
+                ORDER BY timestamp DESC
+            """
+            params.append(limit_per_type)
+
+            grouped: Dict[str, Dict[str, List[Dict]]] = {}
+            for row in conn.execute(sql, params):
+                grouped.setdefault(row['context'], {}).setdefault(row['observation_type'], []).append(dict(row))
+
+            return grouped
+
     # ========================================================================
     # LAYER 2: TIMELINE - Context + Relationships (~200 tokens/result)
     # ========================================================================
@@ -521,6 +582,52 @@ class Hippocampus:
             layer_id=layer_id
         )
 
+    def capture_file_change_many(
+        self,
+        rows: List[Tuple[str, str, str, str, Optional[str]]]
+    ) -> int:
+        """
+        Capture a batch of file change observations in one transaction.
+
+        Args:
+            rows: (file_path, change_type, session_id, context, summary) tuples;
+                  summary may be None to use the default "<Change> <filename>"
+
+        Returns:
+            Number of observations captured
+        """
+        if not rows:
+            return 0
+
+        timestamp = datetime.now().isoformat()
+        params = []
+        for file_path, change_type, session_id, context, summary in rows:
+            if not summary:
+                summary = f"{change_type.capitalize()} {Path(file_path).name}"
+            details = f"File: {file_path}\nChange: {change_type}\nSession: {session_id}"
+            params.append((
+                timestamp,
+                session_id,
+                context,
+                ObservationType.FILE_CHANGE.value,
+                summary,
+                details,
+                file_path,
+            ))
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO observations (
+                    timestamp, session_id, context, observation_type,
+                    summary, details, file_path, layer_id, confidence, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, 1.0, NULL)
+                """,
+                params
+            )
+            conn.commit()
+        return len(params)
+
     # ========================================================================
     # PATTERNS - Pattern Detection
     # ========================================================================